@@ -0,0 +1,129 @@
+"""Game alerts fired once per event from coordinator updates."""
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    ALERT_FINAL,
+    ALERT_HISTORY_SIZE,
+    ALERT_LEAD_CHANGE,
+    ALERT_POSTPONED,
+    ALERT_STARTING_SOON,
+    ALERTS,
+    DOMAIN,
+    EVENT_ALERT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.alerts"
+
+
+def _score(value) -> int:
+    """Return a scoreboard score as a number."""
+    return int(float(value or 0))
+
+
+def _leader(data: dict) -> int:
+    """Return 1 if the team leads, -1 if the opponent leads and 0 on a tie."""
+    margin = _score(data.get("team_score")) - _score(data.get("opponent_score"))
+    return (margin > 0) - (margin < 0)
+
+
+def detect_alerts(previous: dict | None, data: dict) -> list:
+    """Return the alerts raised by a game update, with their dedupe keys.
+
+    A lead change is the team or the opponent taking the lead, including
+    from a tie. Its key holds the score, so each lead change of a game is
+    reported on its own.
+    """
+    event_id = data.get("event_id")
+    state = data.get("state")
+    if event_id is None:
+        return []
+
+    base = f"{event_id}:{data.get('team_abbr')}"
+    alerts = []
+    if state == "PRE" and data.get("private_fast_refresh"):
+        alerts.append((ALERT_STARTING_SOON, f"{base}:{ALERT_STARTING_SOON}"))
+    elif state == "IN" and previous and previous.get("event_id") == event_id:
+        leader = _leader(data)
+        if leader and leader != _leader(previous):
+            score = f"{_score(data.get('team_score'))}-{_score(data.get('opponent_score'))}"
+            alerts.append((ALERT_LEAD_CHANGE, f"{base}:{ALERT_LEAD_CHANGE}:{score}"))
+    elif state == "POST":
+        alerts.append((ALERT_FINAL, f"{base}:{ALERT_FINAL}"))
+    elif state == "POSTPONED":
+        alerts.append((ALERT_POSTPONED, f"{base}:{ALERT_POSTPONED}"))
+    return alerts
+
+
+class AlertEngine:
+    """Fires each game alert once, remembering sent alerts across restarts."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self.hass = hass
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._sent = {}
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+
+    async def async_load(self) -> None:
+        """Load the sent alerts once."""
+        async with self._load_lock:
+            if self._loaded:
+                return
+            stored = await self._store.async_load()
+            if stored:
+                self._sent = dict.fromkeys(stored["sent"])
+            self._loaded = True
+
+    def _data_to_save(self) -> dict:
+        """Return the sent alerts to persist."""
+        return {"sent": list(self._sent)}
+
+    def async_process(
+        self, previous: dict | None, data: dict, enabled: list, league: str
+    ) -> list:
+        """Fire the enabled alerts of a game update that were not sent yet."""
+        fired = []
+        for alert, key in detect_alerts(previous, data):
+            if alert not in enabled or key in self._sent:
+                continue
+            self._sent[key] = None
+            while len(self._sent) > ALERT_HISTORY_SIZE:
+                del self._sent[next(iter(self._sent))]
+
+            event_data = {
+                "type": alert,
+                "league": league,
+                "event_id": data["event_id"],
+                "team": data.get("team_abbr"),
+                "opponent": data.get("opponent_abbr"),
+                "team_score": data.get("team_score"),
+                "opponent_score": data.get("opponent_score"),
+                "date": data.get("date"),
+            }
+            self.hass.bus.async_fire(EVENT_ALERT, event_data)
+            _LOGGER.debug("Fired %s alert for %s", alert, key)
+            fired.append(event_data)
+
+        if fired:
+            self._store.async_delay_save(self._data_to_save, 1)
+        return fired
+
+
+async def async_get_alerts(hass: HomeAssistant) -> AlertEngine:
+    """Return the loaded alert engine shared by every coordinator."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if ALERTS not in domain_data:
+        domain_data[ALERTS] = AlertEngine(hass)
+    engine = domain_data[ALERTS]
+    await engine.async_load()
+    return engine
@@ -0,0 +1,242 @@
+"""ESPN API access for MLB."""
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from functools import partial
+import time
+from typing import Any, Callable
+
+import aiohttp
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util.json import json_loads
+
+from .budget import async_get_budget
+from .const import (
+    API_BASE_URL,
+    CLIENTS,
+    DEFAULT_LEAGUE,
+    DEFAULT_SPORT,
+    DOMAIN,
+    EXECUTOR_PARSE_THRESHOLD,
+    FETCH_LIMIT,
+    FETCH_TIMEOUT,
+    MAX_CONCURRENT_FETCHES,
+    PRIORITY_IDLE,
+    RESERVED_FETCHES,
+    RESPONSE_CACHE_TTL,
+    USER_AGENT,
+)
+
+
+def decode_json(body: bytes, parse: Callable[[Any], Any] | None = None):
+    """Decode a response body and optionally parse the document."""
+    data = json_loads(body)
+    if parse is not None:
+        return parse(data)
+    return data
+
+
+class FetchLimit:
+    """Bounds concurrent ESPN requests, keeping slots for live and pre-game polls.
+
+    Idle requests may only use the unreserved slots, so stalled summary,
+    schedule or team requests can never hold every slot while a live
+    scoreboard poll waits.
+    """
+
+    def __init__(self, slots: int, reserved: int) -> None:
+        """Initialize."""
+        self._slots = asyncio.Semaphore(slots)
+        self._idle_slots = asyncio.Semaphore(slots - reserved)
+        self.in_flight = 0
+
+    @asynccontextmanager
+    async def async_slot(self, priority: int):
+        """Hold a request slot for the duration of the context."""
+        idle = priority >= PRIORITY_IDLE
+        if idle:
+            await self._idle_slots.acquire()
+        try:
+            async with self._slots:
+                self.in_flight += 1
+                try:
+                    yield
+                finally:
+                    self.in_flight -= 1
+        finally:
+            if idle:
+                self._idle_slots.release()
+
+
+def async_get_fetch_limit(hass: HomeAssistant) -> FetchLimit:
+    """Return the limit on concurrent ESPN requests."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if FETCH_LIMIT not in domain_data:
+        domain_data[FETCH_LIMIT] = FetchLimit(MAX_CONCURRENT_FETCHES, RESERVED_FETCHES)
+    return domain_data[FETCH_LIMIT]
+
+
+def _timed(func: Callable, *args):
+    """Call func, returns its result and the CPU time the calling thread spent."""
+    start = time.thread_time()
+    result = func(*args)
+    return result, time.thread_time() - start
+
+
+async def async_fetch_body(
+    hass: HomeAssistant,
+    url: str,
+    priority: int | Callable[[], int] = PRIORITY_IDLE,
+    params: dict | None = None,
+) -> bytes | None:
+    """Fetch a response body from ESPN once the request budget allows it.
+
+    The timeout starts once a concurrency slot is held, so a stalled
+    request frees its slot after FETCH_TIMEOUT seconds rather than after
+    aiohttp's five minute default. The slot is picked by the priority the
+    budget granted the request at.
+    """
+    headers = {"User-Agent": USER_AGENT, "Accept": "application/ld+json"}
+    priority = await async_get_budget(hass).async_acquire(priority)
+    session = async_get_clientsession(hass)
+    async with async_get_fetch_limit(hass).async_slot(priority):
+        timeout = aiohttp.ClientTimeout(total=FETCH_TIMEOUT)
+        async with session.get(url, headers=headers, params=params, timeout=timeout) as r:
+            if r.status != 200:
+                return None
+            return await r.read()
+
+
+class EspnClient:
+    """Fetch and cache layer for one ESPN sport and league.
+
+    All clients share the request budget and Home Assistant's HTTP session.
+    Identical requests made within their TTL, such as the scoreboard polled
+    for several teams, are answered from a single response. Leagues only
+    plug in the parser applied to the decoded document.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, sport: str, league: str, clock=time.monotonic
+    ) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.sport = sport
+        self.league = league
+        self.base_url = API_BASE_URL.format(sport=sport, league=league)
+        self._clock = clock
+        self._cache = {}
+        self._inflight = {}
+        self._priorities = {}
+        self.requests = 0
+        self.cache_hits = 0
+        self.parses = 0
+        self.cpu_time = 0.0
+
+    async def _async_fetch(
+        self, path: str, priority: int | Callable[[], int], params: dict | None, executor: bool
+    ):
+        """Fetch and decode a document, returns the document and its size."""
+        self.requests += 1
+        body = await async_fetch_body(self.hass, f"{self.base_url}/{path}", priority, params)
+        if body is None:
+            return None, 0
+        if executor and len(body) > EXECUTOR_PARSE_THRESHOLD:
+            data, cpu_time = await self.hass.async_add_executor_job(_timed, decode_json, body)
+        else:
+            data, cpu_time = _timed(decode_json, body)
+        self.cpu_time += cpu_time
+        return data, len(body)
+
+    async def async_get(
+        self,
+        path: str,
+        priority: int = PRIORITY_IDLE,
+        params: dict | None = None,
+        parse: Callable[[Any], Any] | None = None,
+        executor: bool = False,
+        ttl: float = RESPONSE_CACHE_TTL,
+    ):
+        """Return a parsed ESPN document, None if ESPN did not answer.
+
+        Requests answered by an in-flight request raise its error, and
+        asyncio.TimeoutError if it was cancelled. The in-flight request
+        waits for the request budget at the best priority of its callers.
+
+        When executor is set, documents larger than EXECUTOR_PARSE_THRESHOLD
+        are decoded and parsed in the executor instead of on the event loop.
+        """
+        key = (path, tuple(sorted((params or {}).items())))
+        cached = self._cache.get(key)
+
+        if cached is not None and self._clock() - cached[0] < ttl:
+            self.cache_hits += 1
+            data, size = cached[1], cached[2]
+        elif key in self._inflight:
+            self.cache_hits += 1
+            future = self._inflight[key]
+            self._priorities[key] = min(self._priorities[key], priority)
+            try:
+                data, size = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The request we were waiting on was cancelled, not us
+                raise asyncio.TimeoutError(f"ESPN request for {path} was cancelled") from None
+        else:
+            future = self.hass.loop.create_future()
+            self._inflight[key] = future
+            self._priorities[key] = priority
+            try:
+                data, size = await self._async_fetch(
+                    path, partial(self._priorities.get, key, priority), params, executor
+                )
+            except Exception as err:
+                future.set_exception(err)
+                # Waiters re-raise it, do not log it as never retrieved
+                future.exception()
+                raise
+            else:
+                future.set_result((data, size))
+            finally:
+                self._inflight.pop(key, None)
+                self._priorities.pop(key, None)
+                if not future.done():
+                    future.cancel()
+            if data is not None and ttl:
+                self._cache[key] = (self._clock(), data, size)
+
+        if data is None or parse is None:
+            return data
+        if executor and size > EXECUTOR_PARSE_THRESHOLD:
+            result, cpu_time = await self.hass.async_add_executor_job(_timed, parse, data)
+        else:
+            result, cpu_time = _timed(parse, data)
+        self.parses += 1
+        self.cpu_time += cpu_time
+        return result
+
+    def as_dict(self) -> dict:
+        """Return client usage for diagnostics.
+
+        Every coordinator refresh parses the scoreboard once, so the decode
+        and parse CPU time per parse estimates the CPU cost of a refresh.
+        """
+        return {
+            "base_url": self.base_url,
+            "requests": self.requests,
+            "cache_hits": self.cache_hits,
+            "cpu_ms_per_refresh": round(self.cpu_time * 1000 / max(self.parses, 1), 3),
+        }
+
+
+def async_get_client(
+    hass: HomeAssistant, league: str = DEFAULT_LEAGUE, sport: str = DEFAULT_SPORT
+) -> EspnClient:
+    """Return the ESPN client shared by everything polling a league."""
+    clients = hass.data.setdefault(DOMAIN, {}).setdefault(CLIENTS, {})
+    if (sport, league) not in clients:
+        clients[(sport, league)] = EspnClient(hass, sport, league)
+    return clients[(sport, league)]
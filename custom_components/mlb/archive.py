@@ -0,0 +1,164 @@
+"""Append-only archive of finished games."""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+
+from homeassistant.core import HomeAssistant
+
+from .const import ARCHIVE, DEFAULT_LEAGUE, DOMAIN
+from .stats import SeasonStats
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _score(value) -> int | None:
+    """Return a score from either the scoreboard or the team endpoint."""
+    if value is None:
+        return None
+    return int(float(value))
+
+
+def build_record(values: dict, league: str = DEFAULT_LEAGUE) -> dict:
+    """Return the compact archive record for a finished game."""
+    return {
+        "id": values["event_id"],
+        "league": league,
+        "date": values["date"],
+        "season": int(values["date"][:4]),
+        "team": values["team_abbr"],
+        "opponent": values["opponent_abbr"],
+        "homeaway": values["team_homeaway"],
+        "team_score": _score(values["team_score"]),
+        "opponent_score": _score(values["opponent_score"]),
+        "team_record": values["team_record"],
+        "opponent_record": values["opponent_record"],
+        "venue": values["venue"],
+        "team_linescore": values.get("team_linescore", []),
+        "opponent_linescore": values.get("opponent_linescore", []),
+    }
+
+
+class GameArchive:
+    """One compact JSON line per finished game, one segment file per season.
+
+    Games are indexed by league and team, team abbreviations are only
+    unique within a league. Records archived before leagues were stored
+    belong to the default league.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: str) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.path = path
+        self._games = {}
+        self._seen = set()
+        self._stats = {}
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+
+    def _segment(self, season: int) -> str:
+        """Return the segment file for a season."""
+        return os.path.join(self.path, f"{season}.jsonl")
+
+    def _read(self) -> list:
+        """Read every segment file."""
+        records = []
+        if not os.path.isdir(self.path):
+            return records
+        for name in sorted(os.listdir(self.path)):
+            if not name.endswith(".jsonl"):
+                continue
+            with open(os.path.join(self.path, name), encoding="utf-8") as segment:
+                for line in segment:
+                    if line.strip():
+                        records.append(json.loads(line))
+        return records
+
+    def _write(self, record: dict) -> None:
+        """Append a record to its season segment."""
+        os.makedirs(self.path, exist_ok=True)
+        with open(self._segment(record["season"]), "a", encoding="utf-8") as segment:
+            segment.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+    def _index(self, record: dict) -> None:
+        """Add a record to the in-memory index."""
+        league = record.setdefault("league", DEFAULT_LEAGUE)
+        self._seen.add((league, record["id"], record["team"]))
+        self._games.setdefault((league, record["team"]), []).append(record)
+        key = (league, record["team"], record["season"])
+        if key not in self._stats:
+            self._stats[key] = SeasonStats(record["team"], record["season"])
+        self._stats[key].add(record)
+
+    async def async_load(self) -> None:
+        """Load the archive from disk once."""
+        async with self._load_lock:
+            if self._loaded:
+                return
+            records = await self.hass.async_add_executor_job(self._read)
+            for record in sorted(records, key=lambda game: game["date"]):
+                self._index(record)
+            self._loaded = True
+            _LOGGER.debug("Loaded %s archived games", len(self._seen))
+
+    async def async_add(self, values: dict, league: str = DEFAULT_LEAGUE) -> dict | None:
+        """Archive a finished game, returns None if it is already archived."""
+        record = build_record(values, league)
+        key = (league, record["id"], record["team"])
+        if key in self._seen:
+            return None
+        # Mark the game before writing, so overlapping refreshes append it once
+        self._seen.add(key)
+        try:
+            await self.hass.async_add_executor_job(self._write, record)
+        except BaseException:
+            self._seen.discard(key)
+            raise
+        self._index(record)
+        _LOGGER.debug("Archived %s game %s", record["team"], record["id"])
+        return record
+
+    def last_games(self, team: str, count: int = 10, league: str = DEFAULT_LEAGUE) -> list:
+        """Return the most recent games of a team, newest first."""
+        return self._games.get((league, team), [])[-count:][::-1]
+
+    def head_to_head(
+        self, team: str, opponent: str, count: int | None = None, league: str = DEFAULT_LEAGUE
+    ) -> list:
+        """Return the games a team played against an opponent, newest first."""
+        games = [
+            game for game in self._games.get((league, team), []) if game["opponent"] == opponent
+        ]
+        if count is not None:
+            games = games[-count:]
+        return games[::-1]
+
+    def season_record(self, team: str, season: int, league: str = DEFAULT_LEAGUE) -> dict:
+        """Return the wins and losses of a team for a season."""
+        stats = self.season_stats(team, season, league)
+        return {"wins": stats["wins"], "losses": stats["losses"]}
+
+    def season_stats(
+        self, team: str, season: int | None = None, league: str = DEFAULT_LEAGUE
+    ) -> dict:
+        """Return the season aggregates of a team, latest season by default."""
+        if season is None:
+            games = self._games.get((league, team))
+            season = games[-1]["season"] if games else None
+        stats = self._stats.get((league, team, season))
+        if stats is None:
+            stats = SeasonStats(team, season)
+        return stats.as_dict()
+
+
+async def async_get_archive(hass: HomeAssistant) -> GameArchive:
+    """Return the loaded archive of finished games."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if ARCHIVE not in domain_data:
+        domain_data[ARCHIVE] = GameArchive(hass, hass.config.path(DOMAIN))
+    archive = domain_data[ARCHIVE]
+    await archive.async_load()
+    return archive
@@ -0,0 +1,130 @@
+"""Request budget shared by every ESPN call the integration makes."""
+import asyncio
+import logging
+import time
+from typing import Callable
+
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    BUDGET,
+    DOMAIN,
+    PRIORITY_IDLE,
+    PRIORITY_LIVE,
+    PRIORITY_PRE,
+    REQUEST_BUDGET_BURST,
+    REQUEST_BUDGET_PER_MINUTE,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Share of the bucket each priority must leave untouched for the ones above it.
+# Live polls may drain the bucket, pre-game polls keep a quarter for live games
+# and off-day lookups keep half so they are the first to be deferred.
+PRIORITY_RESERVE = {
+    PRIORITY_LIVE: 0.0,
+    PRIORITY_PRE: 0.25,
+    PRIORITY_IDLE: 0.5,
+}
+
+PRIORITY_NAMES = {
+    PRIORITY_LIVE: "live",
+    PRIORITY_PRE: "pre",
+    PRIORITY_IDLE: "idle",
+}
+
+
+class RequestBudget:
+    """Token bucket that paces ESPN requests by coordinator priority.
+
+    Requests that cannot be served right away are deferred until enough
+    tokens have been refilled, they are never dropped.
+    """
+
+    def __init__(self, per_minute: int, burst: int, clock=time.monotonic) -> None:
+        """Initialize."""
+        self.rate = per_minute / 60
+        self.capacity = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._waiting = dict.fromkeys(PRIORITY_RESERVE, 0)
+        self.granted = dict.fromkeys(PRIORITY_RESERVE, 0)
+        self.deferred = dict.fromkeys(PRIORITY_RESERVE, 0)
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last call."""
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _needed(self, priority: int) -> float:
+        """Return the tokens that must be in the bucket to serve priority."""
+        return 1 + self.capacity * PRIORITY_RESERVE[priority]
+
+    def _outranked(self, priority: int) -> bool:
+        """Return True if a higher priority request is already waiting."""
+        return any(count for prio, count in self._waiting.items() if prio < priority)
+
+    async def async_acquire(self, priority: int | Callable[[], int] = PRIORITY_IDLE) -> int:
+        """Wait until a request of the given priority may be sent.
+
+        priority may be a callable for requests shared by several callers,
+        it is read again while the request is deferred so a caller of
+        higher priority joining it speeds it up. Returns the priority the
+        request was granted at.
+        """
+        current = priority() if callable(priority) else priority
+        self._refill()
+        if self._tokens >= self._needed(current) and not self._outranked(current):
+            self._tokens -= 1
+            self.granted[current] += 1
+            return current
+
+        _LOGGER.debug(
+            "Request budget is tight, deferring %s poll", PRIORITY_NAMES[current]
+        )
+        self.deferred[current] += 1
+        self._waiting[current] += 1
+        try:
+            while True:
+                self._refill()
+                if callable(priority) and priority() != current:
+                    self._waiting[current] -= 1
+                    current = priority()
+                    self._waiting[current] += 1
+                needed = self._needed(current)
+                if self._tokens >= needed and not self._outranked(current):
+                    break
+                delay = max(needed - self._tokens, 1) / self.rate
+                if callable(priority):
+                    # Check for a raised priority every time a token is refilled
+                    delay = min(delay, 1 / self.rate)
+                await asyncio.sleep(delay)
+            self._tokens -= 1
+            self.granted[current] += 1
+        finally:
+            self._waiting[current] -= 1
+        return current
+
+    def as_dict(self) -> dict:
+        """Return budget usage for diagnostics."""
+        self._refill()
+        return {
+            "requests_per_minute": round(self.rate * 60),
+            "burst": self.capacity,
+            "tokens_available": round(self._tokens, 2),
+            "granted": {PRIORITY_NAMES[p]: n for p, n in self.granted.items()},
+            "deferred": {PRIORITY_NAMES[p]: n for p, n in self.deferred.items()},
+            "waiting": {PRIORITY_NAMES[p]: n for p, n in self._waiting.items()},
+        }
+
+
+def async_get_budget(hass: HomeAssistant) -> RequestBudget:
+    """Return the request budget shared by every coordinator."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if BUDGET not in domain_data:
+        domain_data[BUDGET] = RequestBudget(
+            REQUEST_BUDGET_PER_MINUTE, REQUEST_BUDGET_BURST
+        )
+    return domain_data[BUDGET]
@@ -10,13 +10,26 @@ from homeassistant import config_entries
 from homeassistant.const import CONF_NAME
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers import config_validation as cv
 
 from .const import (
+    ALERT_TYPES,
+    CONF_ALERTS,
+    CONF_ENRICHMENT,
+    CONF_LEAGUE,
+    CONF_PARSE_IN_EXECUTOR,
+    CONF_PROFILE,
     CONF_TIMEOUT,
     CONF_TEAM_ID,
+    DEFAULT_ALERTS,
+    DEFAULT_ENRICHMENT,
+    DEFAULT_LEAGUE,
     DEFAULT_NAME,
+    DEFAULT_PARSE_IN_EXECUTOR,
+    DEFAULT_PROFILE,
     DEFAULT_TIMEOUT,
     DOMAIN,
+    PROFILES,
     USER_AGENT,
 )
 
@@ -45,6 +58,41 @@ def _get_schema(hass: Any, user_input: list, default_dict: list) -> Any:
     )
 
 
+def _get_options_schema(hass: Any, user_input: list, default_dict: list) -> Any:
+    """Gets the options schema using the default_dict as a backup."""
+    if user_input is None:
+        user_input = {}
+
+    def _get_default(key, fallback=None):
+        """Gets default value for key."""
+        return user_input.get(key, default_dict.get(key, fallback))
+
+    return _get_schema(hass, user_input, default_dict).extend(
+        {
+            vol.Optional(
+                CONF_PROFILE,
+                default=_get_default(CONF_PROFILE, DEFAULT_PROFILE),
+            ): vol.In(PROFILES),
+            vol.Optional(
+                CONF_PARSE_IN_EXECUTOR,
+                default=_get_default(CONF_PARSE_IN_EXECUTOR, DEFAULT_PARSE_IN_EXECUTOR),
+            ): bool,
+            vol.Optional(
+                CONF_ENRICHMENT,
+                default=_get_default(CONF_ENRICHMENT, DEFAULT_ENRICHMENT),
+            ): bool,
+            vol.Optional(
+                CONF_LEAGUE,
+                default=_get_default(CONF_LEAGUE, DEFAULT_LEAGUE),
+            ): str,
+            vol.Optional(
+                CONF_ALERTS,
+                default=_get_default(CONF_ALERTS, DEFAULT_ALERTS),
+            ): cv.multi_select({alert: alert.replace("_", " ") for alert in ALERT_TYPES}),
+        }
+    )
+
+
 async def _get_team_list(self):
     """Return list of team acronyms"""
 
@@ -144,7 +192,7 @@ class MLBScoresOptionsFlow(config_entries.OptionsFlow):
     def __init__(self, config_entry):
         """Initialize."""
         self.config = config_entry
-        self._data = dict(config_entry.options)
+        self._data = {**config_entry.data, **config_entry.options}
         self._errors = {}
 
     async def async_step_init(self, user_input=None):
@@ -159,6 +207,6 @@ class MLBScoresOptionsFlow(config_entries.OptionsFlow):
 
         return self.async_show_form(
             step_id="init",
-            data_schema=_get_schema(self.hass, user_input, self._data),
+            data_schema=_get_options_schema(self.hass, user_input, self._data),
             errors=self._errors,
         )
@@ -1,17 +1,100 @@
 # API
-API_SCOREBOARD_ENDPOINT = "http://site.api.espn.com/apis/site/v2/sports/baseball/mlb/scoreboard"
-API_TEAM_ENDPOINT = "http://site.api.espn.com/apis/site/v2/sports/baseball/mlb/teams/"
+API_BASE_URL = "http://site.api.espn.com/apis/site/v2/sports/{sport}/{league}"
+API_SCOREBOARD_PATH = "scoreboard"
+API_TEAM_PATH = "teams/"
+API_SUMMARY_PATH = "summary"
 
 USER_AGENT = "Mozilla/5.0 (Windows NT 6.1; Win64; x64; rv:47.0) Gecko/20100101 Firefox/47.0"
 
 # Config
 CONF_TIMEOUT = "timeout"
 CONF_TEAM_ID = "team_id"
+CONF_PARSE_IN_EXECUTOR = "parse_in_executor"
+CONF_ENRICHMENT = "enrichment"
+CONF_LEAGUE = "league"
+CONF_ALERTS = "alerts"
+CONF_PROFILE = "profile"
 
 # Defaults
 DEFAULT_ICON = "mdi:baseball"
+SEASON_ICON = "mdi:chart-line"
 DEFAULT_NAME = "MLB"
 DEFAULT_TIMEOUT = 120
+DEFAULT_PARSE_IN_EXECUTOR = True
+DEFAULT_ENRICHMENT = False
+DEFAULT_SPORT = "baseball"
+DEFAULT_LEAGUE = "mlb"
+DEFAULT_ALERTS = []
+
+# Performance profiles
+PROFILE_STANDARD = "standard"
+PROFILE_ECO = "eco"
+PROFILES = (PROFILE_STANDARD, PROFILE_ECO)
+DEFAULT_PROFILE = PROFILE_STANDARD
+
+# Polling intervals (seconds), the eco profile caps live polling
+FAST_INTERVAL = 5
+ECO_FAST_INTERVAL = 30
+SLOW_INTERVAL = 600
+
+# Identical ESPN requests within this many seconds share one response
+RESPONSE_CACHE_TTL = 4
+
+# ESPN requests in flight at once, across every config entry
+MAX_CONCURRENT_FETCHES = 2
+
+# Of those, slots idle requests (summaries, schedules, team lookups) may not use
+RESERVED_FETCHES = 1
+
+# Seconds an ESPN request may hold one of those slots
+FETCH_TIMEOUT = 30
+
+# Payloads above this size (bytes) are decoded off the event loop
+EXECUTOR_PARSE_THRESHOLD = 64 * 1024
+
+# Request budget, shared by every config entry
+REQUEST_BUDGET_PER_MINUTE = 120
+REQUEST_BUDGET_BURST = 20
+
+# Schedule loader, refreshed once a day
+SCHEDULE_DAYS = 14
+SCHEDULE_CHUNK_DAYS = 7
+SCHEDULE_LIMIT = 500
+
+# Game summary enrichment
+ENRICHMENT_LIVE_INTERVAL = 120
+SUMMARY_CACHE_SIZE = 32
+SUMMARY_BATTING_STATS = ("hits", "runs", "homeRuns", "RBIs", "walks", "strikeouts")
+SUMMARY_PITCHING_STATS = ("innings", "hits", "earnedRuns", "walks", "strikeouts", "pitches")
+
+# Recent plays kept per game, for this many games
+PLAY_HISTORY_SIZE = 25
+PLAY_HISTORY_GAMES = 16
+
+# Game alerts, fired as EVENT_ALERT on the event bus
+EVENT_ALERT = "mlb_alert"
+ALERT_STARTING_SOON = "starting_soon"
+ALERT_LEAD_CHANGE = "lead_change"
+ALERT_FINAL = "final"
+ALERT_POSTPONED = "postponed"
+ALERT_TYPES = (ALERT_STARTING_SOON, ALERT_LEAD_CHANGE, ALERT_FINAL, ALERT_POSTPONED)
+ALERT_HISTORY_SIZE = 1000
+
+# Game fields streamed to websocket subscribers
+GAME_DELTA_FIELDS = (
+    "event_id",
+    "state",
+    "inning",
+    "team_score",
+    "opponent_score",
+    "last_play",
+    "situation",
+)
+
+# Coordinator priorities, lower numbers are served first
+PRIORITY_LIVE = 0
+PRIORITY_PRE = 1
+PRIORITY_IDLE = 2
 
 # Misc
 TEAM_ID = ""
@@ -21,4 +104,21 @@ DOMAIN = "mlb"
 PLATFORM = "sensor"
 ATTRIBUTION = "Data provided by ESPN"
 COORDINATOR = "coordinator"
+COORDINATORS = "coordinators"
+BUDGET = "budget"
+CLIENTS = "clients"
+FETCH_LIMIT = "fetch_limit"
+ARCHIVE = "archive"
+SCHEDULE = "schedule"
+SUMMARIES = "summaries"
+ALERTS = "alerts"
+PLAYS = "plays"
+
+# Services
+SERVICE_GET_GAMES = "get_games"
+SERVICE_GET_SEASON_STATS = "get_season_stats"
+SERVICE_GET_PLAYS = "get_plays"
+ATTR_OPPONENT = "opponent"
+ATTR_LIMIT = "limit"
+ATTR_SEASON = "season"
 PLATFORMS = ["sensor"]
@@ -0,0 +1,684 @@
+"""MLB data update coordinator."""
+from asyncio import timeout
+import logging
+from datetime import timedelta
+from functools import partial
+import zlib
+
+from homeassistant.const import CONF_NAME
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from .api import async_get_client
+from .archive import async_get_archive
+from .const import (
+    API_SCOREBOARD_PATH,
+    API_TEAM_PATH,
+    CONF_ALERTS,
+    CONF_ENRICHMENT,
+    CONF_LEAGUE,
+    CONF_PARSE_IN_EXECUTOR,
+    CONF_PROFILE,
+    CONF_TEAM_ID,
+    CONF_TIMEOUT,
+    COORDINATORS,
+    DEFAULT_ALERTS,
+    DEFAULT_ENRICHMENT,
+    DEFAULT_LEAGUE,
+    DEFAULT_PARSE_IN_EXECUTOR,
+    DEFAULT_PROFILE,
+    DEFAULT_TIMEOUT,
+    DOMAIN,
+    ECO_FAST_INTERVAL,
+    FAST_INTERVAL,
+    PRIORITY_IDLE,
+    PRIORITY_LIVE,
+    PRIORITY_PRE,
+    PROFILE_ECO,
+    PROFILE_STANDARD,
+    SLOW_INTERVAL,
+)
+from .plays import async_get_plays
+from .schedule import async_get_schedule
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def humanize(date, now) -> str:
+    """Return how far a datetime is from now, eg. "in 30 minutes" or "2 hours ago"."""
+    delta = (date - now).total_seconds()
+    seconds = abs(delta)
+    if seconds < 45:
+        return "just now"
+    if seconds < 90:
+        text = "a minute"
+    elif seconds < 2700:
+        text = "%d minutes" % round(seconds / 60)
+    elif seconds < 5400:
+        text = "an hour"
+    elif seconds < 79200:
+        text = "%d hours" % round(seconds / 3600)
+    elif seconds < 129600:
+        text = "a day"
+    else:
+        text = "%d days" % round(seconds / 86400)
+    return "in %s" % text if delta > 0 else "%s ago" % text
+
+
+def coordinator_phase(league: str) -> float:
+    """Return the fraction of the polling interval a league's polls are offset by.
+
+    Every coordinator of a league shares the phase, so their scoreboard polls
+    land together and are answered by one request. Leagues are spread over
+    the interval.
+    """
+    return zlib.crc32(league.encode()) / 2**32
+
+
+def signal_game_updated(team_id: str, league: str = DEFAULT_LEAGUE) -> str:
+    """Return the dispatcher signal sent when the game of a team is updated."""
+    return f"{DOMAIN}_game_updated_{league}_{team_id.upper()}"
+
+
+def same_game(previous: dict | None, data: dict) -> bool:
+    """Return True if an update only differs from the previous one by its poll time."""
+    if not previous:
+        return False
+    return {key: value for key, value in previous.items() if key != "last_update"} == {
+        key: value for key, value in data.items() if key != "last_update"
+    }
+
+
+def merge_configs(configs: list) -> dict:
+    """Return the polling options of a coordinator shared by several consumers.
+
+    Alerts are combined, enrichment and executor parsing are on when any
+    consumer turns them on, and the eco profile only applies when every
+    consumer selected it, so no consumer gets less than it configured. The
+    longest timeout is used.
+    """
+    config = dict(configs[0])
+    config[CONF_ALERTS] = sorted(
+        {alert for consumer in configs for alert in consumer.get(CONF_ALERTS, DEFAULT_ALERTS)}
+    )
+    config[CONF_ENRICHMENT] = any(
+        consumer.get(CONF_ENRICHMENT, DEFAULT_ENRICHMENT) for consumer in configs
+    )
+    config[CONF_PARSE_IN_EXECUTOR] = any(
+        consumer.get(CONF_PARSE_IN_EXECUTOR, DEFAULT_PARSE_IN_EXECUTOR) for consumer in configs
+    )
+    eco = all(consumer.get(CONF_PROFILE, DEFAULT_PROFILE) == PROFILE_ECO for consumer in configs)
+    config[CONF_PROFILE] = PROFILE_ECO if eco else PROFILE_STANDARD
+    config[CONF_TIMEOUT] = max(consumer.get(CONF_TIMEOUT, DEFAULT_TIMEOUT) for consumer in configs)
+    return config
+
+
+class AlertsDataUpdateCoordinator(DataUpdateCoordinator):
+    """Class to manage fetching MLB data."""
+
+    def __init__(self, hass, config, the_timeout: int, clock=dt_util.utcnow, phase=None):
+        """Initialize.
+
+        clock returns the current UTC time, every polling decision reads it.
+        """
+        self.interval = timedelta(seconds=SLOW_INTERVAL)
+        self.name = config[CONF_NAME]
+        self.timeout = the_timeout
+        self.config = config
+        self.league = config.get(CONF_LEAGUE, DEFAULT_LEAGUE)
+        self.phase = coordinator_phase(self.league) if phase is None else phase
+        self.hass = hass
+        self.clock = clock
+        self._consumers = {}
+
+        _LOGGER.debug("Data will be updated every %s", self.interval)
+
+        super().__init__(hass, _LOGGER, name=self.name, update_interval=self.interval)
+
+    @property
+    def consumers(self) -> int:
+        """Return the number of entries attached to the coordinator."""
+        return len(self._consumers)
+
+    @callback
+    def async_attach(self, consumer_id: str, config) -> None:
+        """Attach a consumer, its options are merged with the other consumers'."""
+        self._consumers[consumer_id] = config
+        self._async_merge_configs()
+
+    @callback
+    def async_detach(self, consumer_id: str) -> None:
+        """Detach a consumer, its options no longer apply."""
+        self._consumers.pop(consumer_id, None)
+        if self._consumers:
+            self._async_merge_configs()
+
+    @callback
+    def _async_merge_configs(self) -> None:
+        """Apply the merged options of every consumer from the next refresh."""
+        self.config = merge_configs(list(self._consumers.values()))
+        self.timeout = self.config[CONF_TIMEOUT]
+        _LOGGER.debug("Polling %s with %s", self.name, self.config)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update listeners and websocket subscribers of the team.
+
+        Subscribers listen to the team's signal rather than to the
+        coordinator, so they keep getting updates when it is replaced.
+        """
+        super().async_update_listeners()
+        if self.data is not None:
+            async_dispatcher_send(
+                self.hass, signal_game_updated(self.config[CONF_TEAM_ID], self.league), self.data
+            )
+
+    @property
+    def eco(self) -> bool:
+        """Return True if the eco performance profile is selected."""
+        return self.config.get(CONF_PROFILE, DEFAULT_PROFILE) == PROFILE_ECO
+
+    @property
+    def fast_interval(self) -> timedelta:
+        """Return the polling interval around and during a game."""
+        return timedelta(seconds=ECO_FAST_INTERVAL if self.eco else FAST_INTERVAL)
+
+    @property
+    def enrichment_enabled(self) -> bool:
+        """Return True if game summaries are fetched, never in the eco profile."""
+        return not self.eco and self.config.get(CONF_ENRICHMENT, DEFAULT_ENRICHMENT)
+
+    @property
+    def priority(self) -> int:
+        """Return the request budget priority for the next poll."""
+        if self.data is None:
+            return PRIORITY_PRE
+        if self.data.get("state") == "IN":
+            return PRIORITY_LIVE
+        if self.data.get("private_fast_refresh"):
+            return PRIORITY_PRE
+        return PRIORITY_IDLE
+
+    async def _async_update_data(self):
+        """Fetch data"""
+        async with timeout(self.timeout):
+            try:
+                data = await update_game(self.hass, self.config, self.priority, self.clock())
+                # update the interval based on flag
+                if data["private_fast_refresh"] == True:
+                    self.interval = self.fast_interval
+                else:
+                    self.interval = timedelta(seconds=SLOW_INTERVAL)
+                self.update_interval = self._next_poll(self.interval)
+            except Exception as error:
+                raise UpdateFailed(error) from error
+            # last_update is the time the game last changed, an unchanged
+            # poll then writes an identical state and no history row
+            if same_game(self.data, data):
+                data["last_update"] = self.data["last_update"]
+            if data.get("last_play"):
+                async_get_plays(self.hass).add(data)
+            if data["state"] == "POST":
+                await self._async_archive(data)
+            if self.enrichment_enabled:
+                self._async_schedule_enrichment(data)
+            alerts = self.config.get(CONF_ALERTS, DEFAULT_ALERTS)
+            if alerts:
+                await self._async_alert(data, alerts)
+            return data
+
+    def _next_poll(self, interval: timedelta) -> timedelta:
+        """Return the delay to the next poll slot of this coordinator's phase.
+
+        Delays stay between half and one and a half intervals, so a poll is
+        never skipped or doubled when the interval changes.
+        """
+        seconds = interval.total_seconds()
+        now = self.clock().timestamp()
+        delay = seconds - (now - self.phase * seconds) % seconds
+        if delay < seconds / 2:
+            delay += seconds
+        return timedelta(seconds=delay)
+
+    @property
+    def enrichment(self) -> dict | None:
+        """Return the cached summary of the tracked game."""
+        if self.data is None or not self.enrichment_enabled:
+            return None
+        from .enrichment import async_get_summaries
+
+        return async_get_summaries(self.hass, self.league).get(self.data.get("event_id"))
+
+    def _async_schedule_enrichment(self, data: dict) -> None:
+        """Refresh the summary of the tracked game in the background."""
+        from .enrichment import async_get_summaries
+
+        event_id = data.get("event_id")
+        summaries = async_get_summaries(self.hass, self.league)
+        if event_id is None or not summaries.is_stale(event_id, data["state"]):
+            return
+        self.hass.async_create_background_task(
+            self._async_enrich(summaries, event_id, data["state"]),
+            f"{DOMAIN} summary {event_id}",
+        )
+
+    async def _async_enrich(self, summaries, event_id: str, state: str) -> None:
+        """Fetch a game summary and let the entities pick it up."""
+        try:
+            await summaries.async_update(event_id, state)
+        except Exception as error:
+            _LOGGER.debug("Unable to fetch summary for %s: %s", event_id, error)
+            return
+        self.async_update_listeners()
+
+    async def _async_alert(self, data: dict, alerts: list) -> None:
+        """Fire the alerts raised since the previous update."""
+        from .alerts import async_get_alerts
+
+        engine = await async_get_alerts(self.hass)
+        engine.async_process(self.data, data, alerts, self.league)
+
+    async def _async_archive(self, data: dict) -> None:
+        """Store a finished game in the archive."""
+        try:
+            archive = await async_get_archive(self.hass)
+            await archive.async_add(data, self.league)
+        except (OSError, ValueError) as error:
+            _LOGGER.warning("Unable to archive game %s: %s", data.get("event_id"), error)
+
+
+def coordinator_key(team_id: str, league: str = DEFAULT_LEAGUE) -> tuple:
+    """Return the registry key of the coordinator polling a team."""
+    return (league, team_id.upper())
+
+
+def async_get_coordinator(hass: HomeAssistant, team_id: str, league: str = DEFAULT_LEAGUE):
+    """Return the running coordinator of a team, if any."""
+    registry = hass.data.get(DOMAIN, {}).get(COORDINATORS, {})
+    return registry.get(coordinator_key(team_id, league))
+
+
+def async_acquire_coordinator(
+    hass: HomeAssistant, config, consumer_id: str
+) -> AlertsDataUpdateCoordinator:
+    """Return the coordinator of a team, shared by every entry configuring it.
+
+    The coordinator is created and refreshed for the first consumer, later
+    consumers attach to it and their options are merged.
+    """
+    registry = hass.data.setdefault(DOMAIN, {}).setdefault(COORDINATORS, {})
+    key = coordinator_key(config[CONF_TEAM_ID], config.get(CONF_LEAGUE, DEFAULT_LEAGUE))
+
+    coordinator = registry.get(key)
+    if coordinator is None:
+        coordinator = AlertsDataUpdateCoordinator(
+            hass, config, config.get(CONF_TIMEOUT, DEFAULT_TIMEOUT)
+        )
+        registry[key] = coordinator
+        # Fetch initial data in the background so entries are set up in
+        # parallel and Home Assistant startup is not held up by ESPN
+        hass.async_create_background_task(
+            coordinator.async_refresh(), f"{DOMAIN} first refresh {key}"
+        )
+    else:
+        _LOGGER.debug("Attaching to the running coordinator for %s", key)
+
+    coordinator.async_attach(consumer_id, config)
+    return coordinator
+
+
+async def async_release_coordinator(
+    hass: HomeAssistant, coordinator: AlertsDataUpdateCoordinator, consumer_id: str
+) -> None:
+    """Detach a consumer, shutting the coordinator down after the last one."""
+    coordinator.async_detach(consumer_id)
+    if coordinator.consumers > 0:
+        return
+
+    key = coordinator_key(coordinator.config[CONF_TEAM_ID], coordinator.league)
+    hass.data[DOMAIN][COORDINATORS].pop(key, None)
+    await coordinator.async_shutdown()
+    _LOGGER.debug("Stopped polling %s", key)
+
+
+async def update_game(hass, config, priority: int, now=None) -> dict:
+    """Fetch new state data for the sensor.
+    This is the only method that should fetch new data for Home Assistant.
+    """
+
+    data = await async_get_state(hass, config, priority, now or dt_util.utcnow())
+    return data
+
+
+async def async_get_state(hass, config, priority: int, now) -> dict:
+    """Query API for status as of now."""
+
+    team_id = config[CONF_TEAM_ID]
+    league = config.get(CONF_LEAGUE, DEFAULT_LEAGUE)
+    eco = config.get(CONF_PROFILE, DEFAULT_PROFILE) == PROFILE_ECO
+    client = async_get_client(hass, league)
+    _LOGGER.debug("Getting state for %s from %s" % (team_id, client.base_url))
+    values = await client.async_get(
+        API_SCOREBOARD_PATH,
+        priority,
+        parse=partial(_find_team_event, team_id=team_id, eco=eco),
+        executor=config.get(CONF_PARSE_IN_EXECUTOR, DEFAULT_PARSE_IN_EXECUTOR),
+    )
+
+    if values is None:
+        raise UpdateFailed("ESPN scoreboard unavailable")
+
+    found_team = bool(values)
+    if not found_team:
+        _LOGGER.debug("Team not found on scoreboard feed.  Checking the schedule.")
+        next_event = await async_get_schedule(hass, league).async_next_game(team_id, now)
+        if next_event is not None:
+            found_team = True
+            values = _parse_scoreboard_event(next_event, team_id, eco)
+
+    if not found_team:
+        _LOGGER.debug("Team not found on schedule.  Using team API.")
+
+        team_path = API_TEAM_PATH + team_id
+        _LOGGER.debug(team_path)
+        data = await client.async_get(team_path, PRIORITY_IDLE)
+        next_event = data["team"]["nextEvent"][0]
+
+        values["state"] = next_event["competitions"][0]["status"]["type"]["state"].upper()
+        if next_event["competitions"][0]["status"]["type"]["state"].lower() in ['post']:
+            _LOGGER.debug("Game State is POST")
+            if next_event["competitions"][0]["status"]["type"]["description"] == "Postponed":
+                _LOGGER.debug("Game is Postponed, set state")
+                values["state"] = "POSTPONED"
+        values["date"] = next_event["date"]
+        values["event_id"] = next_event["id"]
+        team_index = 0 if next_event["competitions"][0]["competitors"][0]["team"]["abbreviation"] == team_id else 1
+        oppo_index = abs((team_index - 1))
+        values["venue"] = next_event["competitions"][0]["venue"]["fullName"]
+        values["location"] = "%s, %s" % (next_event["competitions"][0]["venue"]["address"]["city"],
+                                         next_event["competitions"][0]["venue"]["address"]["state"])
+        try:
+            values["tv_network"] = next_event["competitions"][0]["broadcasts"][0]["media"]["shortName"]
+        except IndexError:
+            values["tv_network"] = None
+        values["team_abbr"] = next_event["competitions"][0]["competitors"][team_index]["team"]["abbreviation"]
+        values["team_id"] = next_event["competitions"][0]["competitors"][team_index]["team"]["id"]
+        values["team_name"] = next_event["competitions"][0]["competitors"][team_index]["team"]["shortDisplayName"]
+        values["team_homeaway"] = next_event["competitions"][0]["competitors"][team_index]["homeAway"]
+        if next_event["competitions"][0]["status"]["type"]["state"].lower() in ['post']:
+            values["team_score"] = next_event["competitions"][0]["competitors"][team_index]["score"]["value"]
+            values["team_record"] = next_event["competitions"][0]["competitors"][team_index]["record"][0][
+                "displayValue"]
+        else:
+            values["team_record"] = None
+            values["team_score"] = None
+        values["team_colors"] = ["#000000", "#000000"]
+        values["team_logo"] = next_event["competitions"][0]["competitors"][team_index]["team"]["logos"][3]["href"]
+        values["team_inning_1"] = 0
+        values["team_inning_2"] = 0
+        values["team_inning_3"] = 0
+        values["team_inning_4"] = 0
+        values["team_inning_5"] = 0
+        values["team_inning_6"] = 0
+        values["team_inning_7"] = 0
+        values["team_inning_8"] = 0
+        values["team_inning_9"] = 0
+        values["opponent_abbr"] = next_event["competitions"][0]["competitors"][oppo_index]["team"]["abbreviation"]
+        values["opponent_id"] = next_event["competitions"][0]["competitors"][oppo_index]["team"]["id"]
+        values["opponent_name"] = next_event["competitions"][0]["competitors"][oppo_index]["team"]["shortDisplayName"]
+        values["opponent_homeaway"] = next_event["competitions"][0]["competitors"][oppo_index]["homeAway"]
+        if next_event["competitions"][0]["status"]["type"]["state"].lower() in ['post']:
+            values["opponent_score"] = next_event["competitions"][0]["competitors"][oppo_index]["score"]["value"]
+            values["opponent_record"] = next_event["competitions"][0]["competitors"][oppo_index]["record"][0]["displayValue"]
+        else:
+            values["opponent_record"] = None
+            values["opponent_score"] = None
+        values["opponent_colors"] = ["#000000", "#000000"]
+        values["opponent_logo"] = next_event["competitions"][0]["competitors"][oppo_index]["team"]["logos"][3]["href"]
+        values["opponent_inning_1"] = 0
+        values["opponent_inning_2"] = 0
+        values["opponent_inning_3"] = 0
+        values["opponent_inning_4"] = 0
+        values["opponent_inning_5"] = 0
+        values["opponent_inning_6"] = 0
+        values["opponent_inning_7"] = 0
+        values["opponent_inning_8"] = 0
+        values["opponent_inning_9"] = 0
+        values["team_linescore"] = []
+        values["opponent_linescore"] = []
+        values["private_fast_refresh"] = False
+        values["last_play"] = None
+        values["last_play_id"] = None
+        values["situation"] = None
+        values["inning"] = None
+        values["clock"] = None
+
+    # Never found the team. Either a bye or a post-season condition
+    # if not found_team:
+    #     _LOGGER.debug("Did not find a game with for the configured team. Checking if it's a bye week.")
+    #     found_bye = False
+    #     values = await async_clear_states(config)
+    #     for bye_team in data["week"]["teamsOnBye"]:
+    #         if team_id.lower() == bye_team["abbreviation"].lower():
+    #             _LOGGER.debug("Bye week confirmed.")
+    #             found_bye = True
+    #             values["team_abbr"] = bye_team["abbreviation"]
+    #             values["team_name"] = bye_team["shortDisplayName"]
+    #             values["team_logo"] = bye_team["logo"]
+    #             values["state"] = 'BYE'
+    #             values["last_update"] = dt_util.now().replace(microsecond=0).isoformat()
+    #     if found_bye == False:
+    #             _LOGGER.debug("Team not found in active games or bye week list. Have you missed the playoffs?")
+    #             values["team_abbr"] = None
+    #             values["team_name"] = None
+    #             values["team_logo"] = None
+    #             values["state"] = 'No Games Found'
+    #             values["last_update"] = dt_util.now().replace(microsecond=0).isoformat()
+
+    values["last_update"] = dt_util.as_local(now).replace(microsecond=0).isoformat()
+
+    if values["state"] == 'PRE' and ((dt_util.parse_datetime(values["date"]) - now).total_seconds() < 1200):
+        _LOGGER.debug("Event is within 20 minutes, setting refresh rate to 5 seconds.")
+        values["private_fast_refresh"] = True
+    elif values["state"] == 'IN':
+        _LOGGER.debug("Event in progress, setting refresh rate to 5 seconds.")
+        values["private_fast_refresh"] = True
+    elif values["state"] in ['POST', 'BYE']: 
+        _LOGGER.debug("Event is over, setting refresh back to 10 minutes.")
+        values["private_fast_refresh"] = False
+
+    return values
+
+
+def _find_team_event(data, team_id, eco=False) -> dict:
+    """Return the parsed scoreboard event of the team, empty if it is not playing."""
+    values = {}
+    for event in data["events"]:
+        if team_id in event["shortName"]:
+            _LOGGER.debug("Found Team_ID in scoreboard feed")
+            values = _parse_scoreboard_event(event, team_id, eco)
+    return values
+
+
+def _parse_scoreboard_event(event, team_id, eco=False) -> dict:
+    """Parse a scoreboard event for the configured team.
+
+    The eco profile skips the per-inning scores, logos and colours, the
+    inning attributes are None and the line scores empty.
+    """
+    values = {}
+    values["state"] = event["status"]["type"]["state"].upper()
+    _LOGGER.debug("Team ID: %s", team_id)
+    team_index = 0 if event["competitions"][0]["competitors"][0]["team"]["abbreviation"] == team_id else 1
+    _LOGGER.debug("Team Index: %s", team_index)
+    oppo_index = abs((team_index - 1))
+    values["state"] = event["competitions"][0]["status"]["type"]["state"].upper()
+    values["date"] = event["date"]
+    values["event_id"] = event["id"]
+    if event["competitions"][0]["status"]["type"]["state"].lower() in ['post']:
+        _LOGGER.debug("Game State is POST")
+        if event["competitions"][0]["status"]["type"]["description"] == "Postponed":
+            _LOGGER.debug("Game is Postponed, set state")
+            values["state"] = "POSTPONED"
+    else:
+        values["state"] = event["competitions"][0]["status"]["type"]["state"].upper()
+    _LOGGER.debug("first pitch date: %s", event["date"])
+    values["venue"] = event["competitions"][0]["venue"]["fullName"]
+    values["location"] = "%s, %s" % (event["competitions"][0]["venue"]["address"]["city"],
+                                     event["competitions"][0]["venue"]["address"]["state"])
+    try:
+        values["tv_network"] = event["competitions"][0]["broadcasts"][0]["names"][0]
+    except IndexError:
+        values["tv_network"] = None
+    values["team_abbr"] = event["competitions"][0]["competitors"][team_index]["team"]["abbreviation"]
+    values["team_id"] = event["competitions"][0]["competitors"][team_index]["team"]["id"]
+    values["team_name"] = event["competitions"][0]["competitors"][team_index]["team"][
+        "shortDisplayName"]
+    try:
+        values["team_record"] = event["competitions"][0]["competitors"][team_index]["records"][0]["summary"]
+    except KeyError:
+        values["team_record"] = '0-0-0'
+    values["team_homeaway"] = event["competitions"][0]["competitors"][team_index]["homeAway"]
+    if eco:
+        values["team_logo"] = None
+        values["team_colors"] = None
+    else:
+        values["team_logo"] = event["competitions"][0]["competitors"][team_index]["team"]["logo"]
+        values["team_colors"] = [
+            ''.join(('#', event["competitions"][0]["competitors"][team_index]["team"]["color"])),
+            ''.join(('#', event["competitions"][0]["competitors"][team_index]["team"]["alternateColor"]))]
+    values["team_score"] = event["competitions"][0]["competitors"][team_index]["score"]
+    for inning in range(1, 10):
+        values[f"team_inning_{inning}"] = None if eco else 0
+    values["opponent_abbr"] = event["competitions"][0]["competitors"][oppo_index]["team"]["abbreviation"]
+    values["opponent_id"] = event["competitions"][0]["competitors"][oppo_index]["team"]["id"]
+    values["opponent_name"] = event["competitions"][0]["competitors"][oppo_index]["team"]["shortDisplayName"]
+    try:
+        values["opponent_record"] = event["competitions"][0]["competitors"][oppo_index]["records"][0]["summary"]
+    except KeyError:
+        values["opponent_record"] = '0-0-0'
+    values["opponent_homeaway"] = event["competitions"][0]["competitors"][oppo_index]["homeAway"]
+    if eco:
+        values["opponent_logo"] = None
+        values["opponent_colors"] = None
+    else:
+        values["opponent_logo"] = event["competitions"][0]["competitors"][oppo_index]["team"]["logo"]
+        values["opponent_colors"] = [
+            ''.join(('#', event["competitions"][0]["competitors"][oppo_index]["team"]["color"])),
+            ''.join(('#', event["competitions"][0]["competitors"][oppo_index]["team"]["alternateColor"]))]
+    values["opponent_score"] = event["competitions"][0]["competitors"][oppo_index]["score"]
+    for inning in range(1, 10):
+        values[f"opponent_inning_{inning}"] = None if eco else 0
+    values["team_linescore"] = []
+    values["opponent_linescore"] = []
+    if not eco and event["competitions"][0]["status"]["type"]["state"].lower() in ['in', 'post']:
+        # The innings actually played, the inning attributes are padded to 9
+        values["team_linescore"] = [
+            score["value"] for score in event["competitions"][0]["competitors"][team_index]["linescores"]
+        ]
+        values["opponent_linescore"] = [
+            score["value"] for score in event["competitions"][0]["competitors"][oppo_index]["linescores"]
+        ]
+        for side in ("team", "opponent"):
+            for inning, score in enumerate(values[f"{side}_linescore"], 1):
+                values[f"{side}_inning_{inning}"] = score
+        _LOGGER.debug("Line score %s - %s", values["team_linescore"], values["opponent_linescore"])
+
+    if event["competitions"][0]["status"]["type"]["state"].lower() in ['in']:
+        situation = event["competitions"][0]["situation"]
+        values["last_play"] = situation["lastPlay"]["text"]
+        values["last_play_id"] = situation["lastPlay"].get("id")
+        values["situation"] = _parse_situation(situation)
+        values["inning"] = event["competitions"][0]["status"]["period"]
+        values["private_fast_refresh"] = True
+    else:
+        values["last_play"] = None
+        values["last_play_id"] = None
+        values["situation"] = None
+        values["inning"] = None
+        values["private_fast_refresh"] = False
+    if event["competitions"][0]["status"]["type"]["state"].lower() in ['post']:  # could use status.completed == true as well
+        values["inning"] = None
+        values["private_fast_refresh"] = False
+
+    return values
+
+
+def _parse_situation(situation) -> dict:
+    """Return the count, outs, runners and matchup of a live game.
+
+    Runners on base are packed in a bitfield: 1 for first, 2 for second
+    and 4 for third.
+    """
+    bases = 0
+    for bit, base in enumerate(("onFirst", "onSecond", "onThird")):
+        if situation.get(base):
+            bases |= 1 << bit
+
+    batter = situation.get("batter", {}).get("athlete", {})
+    pitcher = situation.get("pitcher", {}).get("athlete", {})
+    return {
+        "balls": int(situation.get("balls", 0)),
+        "strikes": int(situation.get("strikes", 0)),
+        "outs": int(situation.get("outs", 0)),
+        "bases": bases,
+        "batter": batter.get("shortName"),
+        "pitcher": pitcher.get("shortName"),
+    }
+
+
+async def async_clear_states(config) -> dict:
+    """Clear all state attributes"""
+    
+    values = {}
+    # Reset values
+    values = {
+        "date": None,
+        "inning": None,
+        "clock": None,
+        "venue": None,
+        "location": None,
+        "tv_network": None,
+        "team_abbr": None,
+        "team_id": None,
+        "team_name": None,
+        "team_record": None,
+        "team_homeaway": None,
+        "team_colors": None,
+        "team_score": None,
+        "team_inning_1": None,
+        "team_inning_2": None,
+        "team_inning_3": None,
+        "team_inning_4": None,
+        "team_inning_5": None,
+        "team_inning_6": None,
+        "team_inning_7": None,
+        "team_inning_8": None,
+        "team_inning_9": None,
+        "opponent_abbr": None,
+        "opponent_id": None,
+        "opponent_name": None,
+        "opponent_record": None,
+        "opponent_homeaway": None,
+        "opponent_logo": None,
+        "opponent_colors": None,
+        "opponent_score": None,
+        "opponent_inning_1": None,
+        "opponent_inning_2": None,
+        "opponent_inning_3": None,
+        "opponent_inning_4": None,
+        "opponent_inning_5": None,
+        "opponent_inning_6": None,
+        "opponent_inning_7": None,
+        "opponent_inning_8": None,
+        "opponent_inning_9": None,
+        "last_play": None,
+        "last_play_id": None,
+        "situation": None,
+        "last_update": None,
+        "private_fast_refresh": False
+    }
+
+    return values
@@ -0,0 +1,61 @@
+"""Diagnostics support for MLB."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .api import async_get_client
+from .budget import async_get_budget
+from .const import (
+    COORDINATOR,
+    DOMAIN,
+    ECO_FAST_INTERVAL,
+    FAST_INTERVAL,
+    PROFILE_ECO,
+    PROFILE_STANDARD,
+    SLOW_INTERVAL,
+)
+
+
+def _requests_per_hour(interval: float) -> int:
+    """Return the scoreboard requests an hour of polling at an interval costs."""
+    return round(3600 / interval)
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+
+    return {
+        "entry": dict(entry.data),
+        "coordinator": {
+            "interval": str(coordinator.interval),
+            "update_interval": str(coordinator.update_interval),
+            "phase": coordinator.phase,
+            "profile": PROFILE_ECO if coordinator.eco else PROFILE_STANDARD,
+            "estimated_requests_per_hour": _requests_per_hour(
+                coordinator.interval.total_seconds()
+            ),
+            "priority": coordinator.priority,
+            "consumers": coordinator.consumers,
+            "last_update_success": coordinator.last_update_success,
+        },
+        "client": async_get_client(hass, coordinator.league).as_dict(),
+        "request_budget": async_get_budget(hass).as_dict(),
+        # Scoreboard requests per hour of each profile, outside of games and
+        # while a game is live. Teams of a league share these requests.
+        "profiles": {
+            PROFILE_STANDARD: {
+                "idle": _requests_per_hour(SLOW_INTERVAL),
+                "live": _requests_per_hour(FAST_INTERVAL),
+            },
+            PROFILE_ECO: {
+                "idle": _requests_per_hour(SLOW_INTERVAL),
+                "live": _requests_per_hour(ECO_FAST_INTERVAL),
+            },
+        },
+    }
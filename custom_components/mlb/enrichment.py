@@ -0,0 +1,137 @@
+"""Game summary enrichment, cached by event id."""
+from __future__ import annotations
+
+import logging
+import time
+
+from homeassistant.core import HomeAssistant
+
+from .api import EspnClient, async_get_client
+from .const import (
+    API_SUMMARY_PATH,
+    DEFAULT_LEAGUE,
+    DOMAIN,
+    ENRICHMENT_LIVE_INTERVAL,
+    PRIORITY_IDLE,
+    SUMMARIES,
+    SUMMARY_CACHE_SIZE,
+    SUMMARY_BATTING_STATS,
+    SUMMARY_PITCHING_STATS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+PITCHERS_OF_RECORD = {
+    "winningPitcher": "winning_pitcher",
+    "losingPitcher": "losing_pitcher",
+    "savingPitcher": "save_pitcher",
+}
+
+
+def _athlete_name(item: dict) -> str | None:
+    """Return the display name of an athlete reference."""
+    return item.get("athlete", {}).get("displayName")
+
+
+def _stats(group: dict, names: tuple) -> dict:
+    """Return the whitelisted stats of a boxscore statistics group."""
+    return {
+        stat["name"]: stat.get("displayValue")
+        for stat in group.get("stats", [])
+        if stat.get("name") in names
+    }
+
+
+def parse_summary(summary: dict) -> dict:
+    """Return probable starters, pitchers of record and box score totals."""
+    competition = summary.get("header", {}).get("competitions", [{}])[0]
+
+    probables = {}
+    for competitor in competition.get("competitors", []):
+        if competitor.get("probables"):
+            probables[competitor["team"]["abbreviation"]] = _athlete_name(
+                competitor["probables"][0]
+            )
+
+    pitchers = {}
+    for featured in competition.get("status", {}).get("featuredAthletes", []):
+        if featured.get("name") in PITCHERS_OF_RECORD:
+            pitchers[PITCHERS_OF_RECORD[featured["name"]]] = _athlete_name(featured)
+
+    boxscore = {}
+    for team in summary.get("boxscore", {}).get("teams", []):
+        totals = {}
+        for group in team.get("statistics", []):
+            if group.get("name") == "batting":
+                totals["batting"] = _stats(group, SUMMARY_BATTING_STATS)
+            elif group.get("name") == "pitching":
+                totals["pitching"] = _stats(group, SUMMARY_PITCHING_STATS)
+        boxscore[team["team"]["abbreviation"]] = totals
+
+    return {
+        "probable_pitchers": probables or None,
+        "pitchers_of_record": pitchers or None,
+        "boxscore": boxscore or None,
+    }
+
+
+class SummaryCache:
+    """Parsed game summaries with a TTL that depends on the game phase.
+
+    A summary is fetched once before the game, at most every
+    ENRICHMENT_LIVE_INTERVAL seconds while it is in progress, and once more
+    when it is final.
+    """
+
+    def __init__(self, client: EspnClient, clock=time.monotonic) -> None:
+        """Initialize."""
+        self.client = client
+        self._clock = clock
+        self._entries = {}
+        self._pending = set()
+
+    def get(self, event_id: str | None) -> dict | None:
+        """Return the cached summary of an event."""
+        entry = self._entries.get(event_id)
+        return entry[2] if entry else None
+
+    def is_stale(self, event_id: str, state: str) -> bool:
+        """Return True if the summary should be fetched again."""
+        if event_id in self._pending:
+            return False
+        entry = self._entries.get(event_id)
+        if entry is None or entry[0] != state:
+            return True
+        if state == "IN":
+            return self._clock() - entry[1] >= ENRICHMENT_LIVE_INTERVAL
+        return False
+
+    async def async_update(self, event_id: str, state: str) -> dict | None:
+        """Fetch and cache the summary of an event."""
+        self._pending.add(event_id)
+        try:
+            summary = await self.client.async_get(
+                API_SUMMARY_PATH,
+                PRIORITY_IDLE,
+                {"event": event_id},
+                parse=parse_summary,
+                executor=True,
+                ttl=0,
+            )
+        finally:
+            self._pending.discard(event_id)
+        if summary is None:
+            return None
+        self._entries.pop(event_id, None)
+        self._entries[event_id] = (state, self._clock(), summary)
+        while len(self._entries) > SUMMARY_CACHE_SIZE:
+            del self._entries[next(iter(self._entries))]
+        return summary
+
+
+def async_get_summaries(hass: HomeAssistant, league: str = DEFAULT_LEAGUE) -> SummaryCache:
+    """Return the summary cache shared by every coordinator of a league."""
+    caches = hass.data.setdefault(DOMAIN, {}).setdefault(SUMMARIES, {})
+    if league not in caches:
+        caches[league] = SummaryCache(async_get_client(hass, league))
+    return caches[league]
@@ -0,0 +1,72 @@
+"""Recent plays of the polled games, kept in bounded ring buffers."""
+from __future__ import annotations
+
+from collections import deque
+import hashlib
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, PLAY_HISTORY_GAMES, PLAY_HISTORY_SIZE, PLAYS
+
+
+def play_key(data: dict) -> str:
+    """Return the dedupe key of the last play, its id or a hash of its text."""
+    if data.get("last_play_id"):
+        return str(data["last_play_id"])
+    text = f"{data.get('inning')}:{data['last_play']}"
+    return hashlib.sha1(text.encode()).hexdigest()[:16]
+
+
+class PlayHistory:
+    """The last plays of each game, newest last, for a bounded number of games."""
+
+    def __init__(self, size: int = PLAY_HISTORY_SIZE, games: int = PLAY_HISTORY_GAMES) -> None:
+        """Initialize."""
+        self._size = size
+        self._max_games = games
+        self._games = {}
+
+    def add(self, data: dict) -> bool:
+        """Record the last play of a coordinator update, returns False if already known."""
+        event_id = data.get("event_id")
+        if event_id is None or not data.get("last_play"):
+            return False
+
+        if event_id not in self._games:
+            self._games[event_id] = (deque(maxlen=self._size), set())
+            while len(self._games) > self._max_games:
+                del self._games[next(iter(self._games))]
+        plays, keys = self._games[event_id]
+
+        key = play_key(data)
+        if key in keys:
+            return False
+        if len(plays) == plays.maxlen:
+            keys.discard(plays[0]["id"])
+        plays.append(
+            {
+                "id": key,
+                "text": data["last_play"],
+                "inning": data.get("inning"),
+                "team_score": data.get("team_score"),
+                "opponent_score": data.get("opponent_score"),
+                "time": data.get("last_update"),
+            }
+        )
+        keys.add(key)
+        return True
+
+    def recent(self, event_id: str | None, count: int | None = None) -> list:
+        """Return the recent plays of a game, newest first."""
+        if event_id not in self._games:
+            return []
+        plays = list(self._games[event_id][0])[::-1]
+        return plays[:count] if count is not None else plays
+
+
+def async_get_plays(hass: HomeAssistant) -> PlayHistory:
+    """Return the play history shared by every coordinator."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if PLAYS not in domain_data:
+        domain_data[PLAYS] = PlayHistory()
+    return domain_data[PLAYS]
@@ -0,0 +1,116 @@
+"""Batched schedule loader for next game lookups."""
+from __future__ import annotations
+
+import asyncio
+from datetime import date, datetime, timedelta
+import logging
+
+import aiohttp
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .api import EspnClient, async_get_client
+from .const import (
+    API_SCOREBOARD_PATH,
+    DEFAULT_LEAGUE,
+    DOMAIN,
+    PRIORITY_IDLE,
+    SCHEDULE,
+    SCHEDULE_CHUNK_DAYS,
+    SCHEDULE_DAYS,
+    SCHEDULE_LIMIT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ScheduleLoader:
+    """Next game of every team, from a few date range scoreboard requests a day.
+
+    The upcoming games of each team are kept, so a game whose first pitch
+    passed since the daily load is skipped for the one after it.
+    """
+
+    def __init__(self, client: EspnClient) -> None:
+        """Initialize."""
+        self.client = client
+        self._next_games = {}
+        self._loaded_on = None
+        self._lock = asyncio.Lock()
+
+    async def _async_fetch_range(self, start: date, end: date) -> list | None:
+        """Fetch every scoreboard event between two dates, None if ESPN failed."""
+        params = {
+            "dates": f"{start:%Y%m%d}-{end:%Y%m%d}",
+            "limit": SCHEDULE_LIMIT,
+        }
+        try:
+            data = await self.client.async_get(
+                API_SCOREBOARD_PATH, PRIORITY_IDLE, params, executor=True, ttl=0
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+            _LOGGER.debug("Unable to fetch schedule %s: %s", params["dates"], error)
+            return None
+        if data is None:
+            return None
+        return data.get("events", [])
+
+    async def async_refresh(self, now: datetime) -> None:
+        """Reload the schedule once per day.
+
+        The day is only marked loaded when every chunk was fetched, a failed
+        chunk is retried on the next lookup. Teams found in the chunks that
+        did load are updated meanwhile.
+        """
+        today = dt_util.as_local(now).date()
+        async with self._lock:
+            if self._loaded_on == today:
+                return
+
+            events = []
+            complete = True
+            for offset in range(0, SCHEDULE_DAYS, SCHEDULE_CHUNK_DAYS):
+                start = today + timedelta(days=offset)
+                end = start + timedelta(days=SCHEDULE_CHUNK_DAYS - 1)
+                chunk = await self._async_fetch_range(start, end)
+                if chunk is None:
+                    complete = False
+                    continue
+                events.extend(chunk)
+
+            next_games = {}
+            for event in sorted(events, key=lambda event: event["date"]):
+                if event["status"]["type"]["state"].lower() == "post":
+                    continue
+                for competitor in event["competitions"][0]["competitors"]:
+                    next_games.setdefault(competitor["team"]["abbreviation"], []).append(event)
+
+            if not complete:
+                self._next_games.update(next_games)
+                _LOGGER.debug("Schedule incomplete, retrying on the next lookup")
+                return
+
+            self._next_games = next_games
+            self._loaded_on = today
+            _LOGGER.debug(
+                "Loaded %s schedule for %s teams from %s events",
+                self.client.league,
+                len(next_games),
+                len(events),
+            )
+
+    async def async_next_game(self, team_id: str, now: datetime) -> dict | None:
+        """Return the next scheduled scoreboard event of a team, None if there is none."""
+        await self.async_refresh(now)
+        for event in self._next_games.get(team_id, []):
+            if dt_util.parse_datetime(event["date"]) > now:
+                return event
+        return None
+
+
+def async_get_schedule(hass: HomeAssistant, league: str = DEFAULT_LEAGUE) -> ScheduleLoader:
+    """Return the schedule loader shared by every coordinator of a league."""
+    loaders = hass.data.setdefault(DOMAIN, {}).setdefault(SCHEDULE, {})
+    if league not in loaders:
+        loaders[league] = ScheduleLoader(async_get_client(hass, league))
+    return loaders[league]
@@ -1,26 +1,40 @@
 import logging
+from types import SimpleNamespace
 import uuid
 
 import voluptuous as vol
 from homeassistant.components.sensor import PLATFORM_SCHEMA
 from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry
-from homeassistant.const import ATTR_ATTRIBUTION, CONF_NAME
+from homeassistant.const import ATTR_ATTRIBUTION, CONF_NAME, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.util import slugify
-from . import AlertsDataUpdateCoordinator
-
+from homeassistant.util import dt as dt_util, slugify
+from .archive import async_get_archive
 from .const import (
+    ALERT_TYPES,
     ATTRIBUTION,
+    CONF_ALERTS,
+    CONF_ENRICHMENT,
+    CONF_LEAGUE,
+    CONF_PARSE_IN_EXECUTOR,
+    CONF_PROFILE,
     CONF_TIMEOUT,
     CONF_TEAM_ID,
     COORDINATOR,
+    DEFAULT_ALERTS,
+    DEFAULT_ENRICHMENT,
+    DEFAULT_LEAGUE,
     DEFAULT_ICON,
     DEFAULT_NAME,
+    DEFAULT_PARSE_IN_EXECUTOR,
+    DEFAULT_PROFILE,
     DEFAULT_TIMEOUT,
     DOMAIN,
+    PROFILES,
+    SEASON_ICON,
 )
+from .coordinator import async_acquire_coordinator, async_release_coordinator, humanize
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,44 +43,63 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
         vol.Required(CONF_TEAM_ID): cv.string,
         vol.Optional(CONF_NAME, default=DEFAULT_NAME): cv.string,
         vol.Optional(CONF_TIMEOUT, default=DEFAULT_TIMEOUT): int,
+        vol.Optional(CONF_PARSE_IN_EXECUTOR, default=DEFAULT_PARSE_IN_EXECUTOR): cv.boolean,
+        vol.Optional(CONF_ENRICHMENT, default=DEFAULT_ENRICHMENT): cv.boolean,
+        vol.Optional(CONF_LEAGUE, default=DEFAULT_LEAGUE): cv.string,
+        vol.Optional(CONF_ALERTS, default=DEFAULT_ALERTS): vol.All(
+            cv.ensure_list, [vol.In(ALERT_TYPES)]
+        ),
+        vol.Optional(CONF_PROFILE, default=DEFAULT_PROFILE): vol.In(PROFILES),
     }
 )
 
 
 async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
     """Configuration from yaml"""
-    if DOMAIN not in hass.data.keys():
-        hass.data.setdefault(DOMAIN, {})
-        config.entry_id = slugify(f"{config.get(CONF_TEAM_ID)}")
-        config.data = config
-    else:
-        config.entry_id = slugify(f"{config.get(CONF_TEAM_ID)}")
-        config.data = config
-
-    # Setup the data coordinator
-    coordinator = AlertsDataUpdateCoordinator(
-        hass,
-        config,
-        config[CONF_TIMEOUT],
-    )
+    hass.data.setdefault(DOMAIN, {})
+    # Stand in for a config entry, the sensors read entry_id and data
+    entry = SimpleNamespace(entry_id=slugify(f"{config.get(CONF_TEAM_ID)}"), data=config)
+
+    # Attach to the data coordinator of the team, shared with config entries
+    coordinator = async_acquire_coordinator(hass, config, entry.entry_id)
 
-    # Fetch initial data so we have data when entities subscribe
-    await coordinator.async_refresh()
+    async def _async_release(_event):
+        """Detach from the coordinator when Home Assistant stops."""
+        await async_release_coordinator(hass, coordinator, entry.entry_id)
 
-    hass.data[DOMAIN][config.entry_id] = {
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_release)
+
+    hass.data[DOMAIN][entry.entry_id] = {
         COORDINATOR: coordinator,
     }
-    async_add_entities([MLBScoresSensor(hass, config)], True)
+    archive = await async_get_archive(hass)
+    async_add_entities(
+        [MLBScoresSensor(hass, entry), MLBSeasonSensor(hass, entry, archive)]
+    )
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
     """Setup the sensor platform."""
-    async_add_entities([MLBScoresSensor(hass, entry)], True)
+    archive = await async_get_archive(hass)
+    async_add_entities(
+        [MLBScoresSensor(hass, entry), MLBSeasonSensor(hass, entry, archive)]
+    )
 
 
 class MLBScoresSensor(CoordinatorEntity):
     """Representation of a Sensor."""
 
+    # Values that change with every play or every minute are kept out of the
+    # recorder's attribute rows, which then only change when the game does
+    _unrecorded_attributes = frozenset(
+        {
+            "first_pitch",
+            "last_update",
+            "last_play",
+            "boxscore",
+        }
+    )
+
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(hass.data[DOMAIN][entry.entry_id][COORDINATOR])
@@ -75,7 +108,6 @@ class MLBScoresSensor(CoordinatorEntity):
         self._icon = DEFAULT_ICON
         self._state = "PRE"
         self._date = None
-        self._first_pitch = None
         self.inning = None
         self._clock = None
         self._venue = None
@@ -157,7 +189,7 @@ class MLBScoresSensor(CoordinatorEntity):
 
         attrs[ATTR_ATTRIBUTION] = ATTRIBUTION
         attrs["date"] = self.coordinator.data["date"]
-        attrs["first_pitch"] = self.coordinator.data["first_pitch"]
+        attrs["first_pitch"] = self._first_pitch()
         attrs["inning"] = self.coordinator.data["inning"]
         attrs["venue"] = self.coordinator.data["venue"]
         attrs["location"] = self.coordinator.data["location"]
@@ -196,12 +228,63 @@ class MLBScoresSensor(CoordinatorEntity):
         attrs["opponent_inning_7"] = self.coordinator.data["opponent_inning_7"]
         attrs["opponent_inning_8"] = self.coordinator.data["opponent_inning_8"]
         attrs["opponent_inning_9"] = self.coordinator.data["opponent_inning_9"]
-        attrs["last_update"] = self.coordinator.data["last_update"]
+        attrs["last_update"] = self.coordinator.data.get("last_update")
         attrs["last_play"] = self.coordinator.data["last_play"]
 
+        enrichment = self.coordinator.enrichment
+        if enrichment is not None:
+            attrs.update(enrichment)
+
         return attrs
 
+    def _first_pitch(self):
+        """Return how far away the game is, computed when the state is written."""
+        if self.coordinator.eco or self.coordinator.data.get("date") is None:
+            return None
+        return humanize(dt_util.parse_datetime(self.coordinator.data["date"]), self.coordinator.clock())
+
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self.coordinator.last_update_success
\ No newline at end of file
+        return self.coordinator.last_update_success
+
+class MLBSeasonSensor(CoordinatorEntity):
+    """Season aggregates of the configured team."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, archive) -> None:
+        """Initialize the sensor."""
+        super().__init__(hass.data[DOMAIN][entry.entry_id][COORDINATOR])
+        self._config = entry
+        self._name = f"{entry.data[CONF_NAME]} Season"
+        self._team_id = entry.data[CONF_TEAM_ID]
+        self._league = entry.data.get(CONF_LEAGUE, DEFAULT_LEAGUE)
+        self._archive = archive
+
+    @property
+    def unique_id(self):
+        """
+        Return a unique, Home Assistant friendly identifier for this entity.
+        """
+        return f"{slugify(self._name)}_{self._config.entry_id}"
+
+    @property
+    def name(self):
+        """Return the name of the sensor."""
+        return self._name
+
+    @property
+    def icon(self):
+        """Return the icon to use in the frontend, if any."""
+        return SEASON_ICON
+
+    @property
+    def state(self):
+        """Return the season record of the team."""
+        return self._archive.season_stats(self._team_id, league=self._league)["record"]
+
+    @property
+    def extra_state_attributes(self):
+        """Return the season aggregates."""
+        attrs = self._archive.season_stats(self._team_id, league=self._league)
+        attrs[ATTR_ATTRIBUTION] = ATTRIBUTION
+        return attrs
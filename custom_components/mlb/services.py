@@ -0,0 +1,118 @@
+"""Services for MLB."""
+from __future__ import annotations
+
+import voluptuous as vol
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.helpers import config_validation as cv
+
+from .archive import async_get_archive
+from .const import (
+    ATTR_LIMIT,
+    ATTR_OPPONENT,
+    ATTR_SEASON,
+    CONF_LEAGUE,
+    CONF_TEAM_ID,
+    DEFAULT_LEAGUE,
+    DOMAIN,
+    PLAY_HISTORY_SIZE,
+    SERVICE_GET_GAMES,
+    SERVICE_GET_PLAYS,
+    SERVICE_GET_SEASON_STATS,
+)
+from .coordinator import async_get_coordinator
+from .plays import async_get_plays
+
+GET_GAMES_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_TEAM_ID): cv.string,
+        vol.Optional(CONF_LEAGUE, default=DEFAULT_LEAGUE): cv.string,
+        vol.Optional(ATTR_OPPONENT): cv.string,
+        vol.Optional(ATTR_SEASON): vol.Coerce(int),
+        vol.Optional(ATTR_LIMIT, default=10): vol.All(vol.Coerce(int), vol.Range(min=1)),
+    }
+)
+
+GET_SEASON_STATS_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_TEAM_ID): cv.string,
+        vol.Optional(CONF_LEAGUE, default=DEFAULT_LEAGUE): cv.string,
+        vol.Optional(ATTR_SEASON): vol.Coerce(int),
+    }
+)
+
+GET_PLAYS_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_TEAM_ID): cv.string,
+        vol.Optional(CONF_LEAGUE, default=DEFAULT_LEAGUE): cv.string,
+        vol.Optional(ATTR_LIMIT, default=10): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=PLAY_HISTORY_SIZE)
+        ),
+    }
+)
+
+
+def async_get_recent_plays(hass: HomeAssistant, team_id: str, league: str, limit: int) -> dict:
+    """Return the recent plays of the game a team is playing."""
+    coordinator = async_get_coordinator(hass, team_id, league)
+    event_id = coordinator.data.get("event_id") if coordinator and coordinator.data else None
+    return {"event_id": event_id, "plays": async_get_plays(hass).recent(event_id, limit)}
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the MLB services."""
+    if hass.services.has_service(DOMAIN, SERVICE_GET_GAMES):
+        return
+
+    async def async_get_games(call: ServiceCall) -> ServiceResponse:
+        """Return archived games for a team."""
+        archive = await async_get_archive(hass)
+        team_id = call.data[CONF_TEAM_ID].upper()
+        league = call.data[CONF_LEAGUE]
+        limit = call.data[ATTR_LIMIT]
+
+        if ATTR_OPPONENT in call.data:
+            games = archive.head_to_head(
+                team_id, call.data[ATTR_OPPONENT].upper(), limit, league
+            )
+        else:
+            games = archive.last_games(team_id, limit, league)
+
+        response = {"games": games}
+        if ATTR_SEASON in call.data:
+            response["record"] = archive.season_record(team_id, call.data[ATTR_SEASON], league)
+        return response
+
+    async def async_get_season_stats(call: ServiceCall) -> ServiceResponse:
+        """Return the precomputed season aggregates for a team."""
+        archive = await async_get_archive(hass)
+        return archive.season_stats(
+            call.data[CONF_TEAM_ID].upper(), call.data.get(ATTR_SEASON), call.data[CONF_LEAGUE]
+        )
+
+    async def async_get_plays_service(call: ServiceCall) -> ServiceResponse:
+        """Return the recent plays of a team's game."""
+        return async_get_recent_plays(
+            hass, call.data[CONF_TEAM_ID], call.data[CONF_LEAGUE], call.data[ATTR_LIMIT]
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_GAMES,
+        async_get_games,
+        schema=GET_GAMES_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_SEASON_STATS,
+        async_get_season_stats,
+        schema=GET_SEASON_STATS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_PLAYS,
+        async_get_plays_service,
+        schema=GET_PLAYS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
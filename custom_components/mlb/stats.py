@@ -0,0 +1,62 @@
+"""Incremental season aggregates built from archived games."""
+from __future__ import annotations
+
+from collections import deque
+
+
+def _record(wins: int, losses: int) -> str:
+    """Return a W-L string."""
+    return f"{wins}-{losses}"
+
+
+class SeasonStats:
+    """Season aggregates of one team, updated once per finished game."""
+
+    def __init__(self, team: str, season: int) -> None:
+        """Initialize."""
+        self.team = team
+        self.season = season
+        self.wins = 0
+        self.losses = 0
+        self.streak = 0
+        self.last_ten = deque(maxlen=10)
+        self.runs_scored = 0
+        self.runs_allowed = 0
+        self.home = [0, 0]
+        self.away = [0, 0]
+
+    def add(self, game: dict) -> None:
+        """Fold an archived game into the aggregates."""
+        won = game["team_score"] > game["opponent_score"]
+        split = self.home if game["homeaway"] == "home" else self.away
+
+        if won:
+            self.wins += 1
+            split[0] += 1
+            self.streak = self.streak + 1 if self.streak > 0 else 1
+        else:
+            self.losses += 1
+            split[1] += 1
+            self.streak = self.streak - 1 if self.streak < 0 else -1
+
+        self.last_ten.append(won)
+        self.runs_scored += game["team_score"]
+        self.runs_allowed += game["opponent_score"]
+
+    def as_dict(self) -> dict:
+        """Return the aggregates as service and sensor attributes."""
+        last_ten_wins = sum(self.last_ten)
+        return {
+            "team": self.team,
+            "season": self.season,
+            "record": _record(self.wins, self.losses),
+            "wins": self.wins,
+            "losses": self.losses,
+            "streak": ("W" if self.streak > 0 else "L") + str(abs(self.streak)) if self.streak else None,
+            "last_10": _record(last_ten_wins, len(self.last_ten) - last_ten_wins),
+            "runs_scored": self.runs_scored,
+            "runs_allowed": self.runs_allowed,
+            "run_differential": self.runs_scored - self.runs_allowed,
+            "home_record": _record(*self.home),
+            "away_record": _record(*self.away),
+        }
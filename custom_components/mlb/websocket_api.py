@@ -0,0 +1,95 @@
+"""Websocket API for MLB."""
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import (
+    ATTR_LIMIT,
+    CONF_LEAGUE,
+    CONF_TEAM_ID,
+    DEFAULT_LEAGUE,
+    GAME_DELTA_FIELDS,
+    PLAY_HISTORY_SIZE,
+)
+from .coordinator import async_get_coordinator, signal_game_updated
+from .services import async_get_recent_plays
+
+
+def _compact(data: dict | None) -> dict:
+    """Return the fields streamed to subscribers."""
+    data = data or {}
+    return {field: data.get(field) for field in GAME_DELTA_FIELDS}
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register the MLB websocket commands."""
+    websocket_api.async_register_command(hass, ws_subscribe_game)
+    websocket_api.async_register_command(hass, ws_get_plays)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "mlb/subscribe_game",
+        vol.Required(CONF_TEAM_ID): str,
+        vol.Optional(CONF_LEAGUE, default=DEFAULT_LEAGUE): str,
+    }
+)
+@callback
+def ws_subscribe_game(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Stream the game of a team, a full snapshot first and then changed fields only.
+
+    The subscription follows the team rather than its coordinator, so it
+    survives the coordinator being replaced when its entries are reloaded.
+    """
+    coordinator = async_get_coordinator(hass, msg[CONF_TEAM_ID], msg[CONF_LEAGUE])
+    if coordinator is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, f"Team {msg[CONF_TEAM_ID]} is not configured"
+        )
+        return
+
+    last = _compact(coordinator.data)
+
+    @callback
+    def _forward_delta(data: dict) -> None:
+        """Send the fields that changed since the last message."""
+        nonlocal last
+        current = _compact(data)
+        delta = {field: value for field, value in current.items() if last[field] != value}
+        if not delta:
+            return
+        last = current
+        connection.send_message(websocket_api.event_message(msg["id"], {"delta": delta}))
+
+    connection.subscriptions[msg["id"]] = async_dispatcher_connect(
+        hass, signal_game_updated(msg[CONF_TEAM_ID], msg[CONF_LEAGUE]), _forward_delta
+    )
+    connection.send_result(msg["id"])
+    connection.send_message(websocket_api.event_message(msg["id"], {"snapshot": last}))
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "mlb/get_plays",
+        vol.Required(CONF_TEAM_ID): str,
+        vol.Optional(CONF_LEAGUE, default=DEFAULT_LEAGUE): str,
+        vol.Optional(ATTR_LIMIT, default=10): vol.All(int, vol.Range(min=1, max=PLAY_HISTORY_SIZE)),
+    }
+)
+@callback
+def ws_get_plays(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return the recent plays of a team's game, newest first."""
+    connection.send_result(
+        msg["id"],
+        async_get_recent_plays(hass, msg[CONF_TEAM_ID], msg[CONF_LEAGUE], msg[ATTR_LIMIT]),
+    )
@@ -0,0 +1,122 @@
+"""Measure event loop block time per refresh for inline and executor parsing.
+
+Builds a full slate scoreboard from tests/fixtures/scoreboard.json and refreshes
+every configured team through EspnClient, as the coordinators do: one decode of
+the scoreboard per refresh and one parse per team. It runs once on the event
+loop and once through the executor, while a probe task records how long the
+loop was blocked.
+
+    python script/benchmark_event_loop.py --games 15 --teams 5
+"""
+import argparse
+import asyncio
+import copy
+import json
+import pathlib
+import statistics
+import sys
+import time
+from functools import partial
+from types import SimpleNamespace
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from custom_components.mlb import api  # noqa: E402
+from custom_components.mlb.const import API_SCOREBOARD_PATH, RESPONSE_CACHE_TTL  # noqa: E402
+from custom_components.mlb.coordinator import _find_team_event  # noqa: E402
+
+# Real ESPN events carry leaders, probables, odds and headlines, which the
+# fixture leaves out. Pad each event to roughly the size of a real one.
+EVENT_PADDING = 20_000
+
+
+def build_slate(games: int) -> bytes:
+    """Return a scoreboard payload with the given number of games."""
+    fixture = json.loads((ROOT / "tests" / "fixtures" / "scoreboard.json").read_text())
+    template = fixture["events"][0]
+    events = []
+    for game in range(games):
+        event = copy.deepcopy(template)
+        away, home = f"A{game:02d}", f"H{game:02d}"
+        event["id"] = str(401569100 + game)
+        event["shortName"] = f"{away} @ {home}"
+        competitors = event["competitions"][0]["competitors"]
+        competitors[0]["team"]["abbreviation"] = home
+        competitors[1]["team"]["abbreviation"] = away
+        event["competitions"][0]["leaders"] = [
+            {"name": f"leader{n}", "displayValue": "x" * 90} for n in range(EVENT_PADDING // 120)
+        ]
+        events.append(event)
+    fixture["events"] = events
+    return json.dumps(fixture).encode()
+
+
+async def _probe(stop: asyncio.Event, blocks: list) -> None:
+    """Record how late the loop wakes up a 1 ms sleeper."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        blocks.append(max(time.perf_counter() - start - 0.001, 0))
+
+
+def build_client(body: bytes, clock) -> api.EspnClient:
+    """Return an ESPN client answering every request with the payload."""
+    loop = asyncio.get_running_loop()
+    hass = SimpleNamespace(
+        loop=loop,
+        data={},
+        async_add_executor_job=lambda func, *args: loop.run_in_executor(None, func, *args),
+    )
+
+    async def fetch_body(hass, url, priority, params=None) -> bytes:
+        """Serve the payload without going to the network."""
+        return body
+
+    api.async_fetch_body = fetch_body
+    return api.EspnClient(hass, "baseball", "mlb", clock=clock)
+
+
+async def run(body: bytes, teams: list, refreshes: int, executor: bool) -> list:
+    """Return the longest loop block of every refresh, in milliseconds."""
+    now = [0.0]
+    client = build_client(body, lambda: now[0])
+    results = []
+    for _ in range(refreshes):
+        # Each refresh starts after the cached scoreboard expired
+        now[0] += RESPONSE_CACHE_TTL + 1
+        stop = asyncio.Event()
+        blocks = []
+        probe = asyncio.create_task(_probe(stop, blocks))
+        await asyncio.sleep(0.002)
+        for team_id in teams:
+            parse = partial(_find_team_event, team_id=team_id)
+            await client.async_get(API_SCOREBOARD_PATH, parse=parse, executor=executor)
+            await asyncio.sleep(0)
+        await asyncio.sleep(0.002)
+        stop.set()
+        await probe
+        results.append(max(blocks) * 1000)
+    return results
+
+
+async def main(args) -> None:
+    """Run the benchmark."""
+    body = build_slate(args.games)
+    teams = [f"A{game:02d}" for game in range(min(args.teams, args.games))]
+    print(f"payload: {len(body) / 1024:.0f} KiB, {args.games} games, {len(teams)} teams")
+
+    for label, executor in (("inline", False), ("executor", True)):
+        blocks = await run(body, teams, args.refreshes, executor)
+        print(
+            f"{label:>8}: loop block per refresh "
+            f"median {statistics.median(blocks):.2f} ms, max {max(blocks):.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=15)
+    parser.add_argument("--teams", type=int, default=5)
+    parser.add_argument("--refreshes", type=int, default=20)
+    asyncio.run(main(parser.parse_args()))
@@ -1,3 +1,11 @@
 """Constants for tests."""
+import json
+import pathlib
 
 CONFIG_DATA = {"name": "MLB", "team_id": "PHI"}
+
+
+def load_fixture(filename):
+    """Load a JSON fixture from tests/fixtures."""
+    path = pathlib.Path(__file__).parent / "fixtures" / filename
+    return json.loads(path.read_text())
@@ -0,0 +1,78 @@
+"""Test the game alert engine."""
+from pytest_homeassistant_custom_component.common import async_capture_events
+
+from custom_components.mlb.alerts import AlertEngine, detect_alerts
+from custom_components.mlb.const import ALERT_TYPES, EVENT_ALERT
+
+PRE = {"event_id": "401569001", "team_abbr": "PHI", "opponent_abbr": "ATL", "state": "PRE"}
+
+
+def _game(state, team_score=None, opponent_score=None, **extra):
+    """Return a coordinator update of the tracked game."""
+    return {
+        **PRE,
+        "state": state,
+        "team_score": team_score,
+        "opponent_score": opponent_score,
+        **extra,
+    }
+
+
+def test_detect_lead_changes():
+    """Test taking the lead is an alert and extending it is not."""
+    tied = _game("IN", "0", "0")
+    lead = _game("IN", "1", "0")
+    assert [alert for alert, _ in detect_alerts(tied, lead)] == ["lead_change"]
+    assert detect_alerts(lead, _game("IN", "3", "0")) == []
+    assert detect_alerts(lead, _game("IN", "1", "1")) == []
+    assert [alert for alert, _ in detect_alerts(lead, _game("IN", "1", "2"))] == ["lead_change"]
+    assert detect_alerts(None, lead) == []
+
+
+async def test_alerts_fire_once(hass, hass_storage):
+    """Test every alert of a game is fired once, across restarts too."""
+    events = async_capture_events(hass, EVENT_ALERT)
+    updates = [
+        _game("PRE"),
+        _game("PRE", private_fast_refresh=True),
+        _game("PRE", private_fast_refresh=True),
+        _game("IN", "0", "0"),
+        _game("IN", "0", "1"),
+        _game("IN", "2", "1"),
+        _game("IN", "2", "1"),
+        _game("POST", "2", "1"),
+    ]
+
+    engine = AlertEngine(hass)
+    await engine.async_load()
+    previous = None
+    for data in updates:
+        engine.async_process(previous, data, list(ALERT_TYPES), "mlb")
+        previous = data
+    await hass.async_block_till_done()
+
+    assert [(event.data["type"], event.data["team_score"]) for event in events] == [
+        ("starting_soon", None),
+        ("lead_change", "0"),
+        ("lead_change", "2"),
+        ("final", "2"),
+    ]
+
+    # Flush the delayed save and reload as after a restart
+    await engine._store.async_save(engine._data_to_save())
+    restarted = AlertEngine(hass)
+    await restarted.async_load()
+    assert restarted.async_process(None, _game("POST", "2", "1"), list(ALERT_TYPES), "mlb") == []
+
+
+async def test_disabled_alerts(hass):
+    """Test only the enabled alerts are fired."""
+    events = async_capture_events(hass, EVENT_ALERT)
+    engine = AlertEngine(hass)
+    await engine.async_load()
+
+    engine.async_process(None, _game("POSTPONED"), ["final"], "mlb")
+    engine.async_process(None, _game("POST", "2", "1"), ["final"], "mlb")
+    await hass.async_block_till_done()
+
+    assert [event.data["type"] for event in events] == ["final"]
@@ -0,0 +1,207 @@
+"""Test the ESPN client."""
+import asyncio
+from contextlib import asynccontextmanager
+from functools import partial
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import aiohttp
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
+import pytest
+
+from custom_components.mlb.api import (
+    EspnClient,
+    async_fetch_body,
+    async_get_client,
+    async_get_fetch_limit,
+)
+from custom_components.mlb.budget import RequestBudget
+from custom_components.mlb.const import (
+    API_SCOREBOARD_PATH,
+    BUDGET,
+    DOMAIN,
+    FETCH_TIMEOUT,
+    PRIORITY_IDLE,
+    PRIORITY_LIVE,
+)
+from custom_components.mlb.coordinator import _find_team_event, async_get_state
+from tests.const import CONFIG_DATA, load_fixture
+
+
+def _session(release: asyncio.Event | None = None, stalled: str = "") -> MagicMock:
+    """Return a fake aiohttp session, requests to stalled URLs wait for release."""
+
+    @asynccontextmanager
+    async def _get(url, **kwargs):
+        if stalled and url.endswith(stalled):
+            await release.wait()
+        yield SimpleNamespace(status=200, read=partial(asyncio.sleep, 0, b"{}"))
+
+    session = MagicMock()
+    session.get.side_effect = _get
+    return session
+
+
+async def test_client_shares_responses(hass, aioclient_mock):
+    """Test concurrent and recent requests are answered by one response."""
+    now = [0.0]
+    client = EspnClient(hass, "baseball", "mlb", clock=lambda: now[0])
+    aioclient_mock.get(
+        f"{client.base_url}/{API_SCOREBOARD_PATH}", json=load_fixture("scoreboard.json")
+    )
+
+    games = await asyncio.gather(
+        *(
+            client.async_get(API_SCOREBOARD_PATH, parse=partial(_find_team_event, team_id=team))
+            for team in ("PHI", "ATL", "NYM")
+        )
+    )
+    assert [game["team_abbr"] for game in games] == ["PHI", "ATL", "NYM"]
+    assert aioclient_mock.call_count == 1
+
+    now[0] += 1
+    await client.async_get(API_SCOREBOARD_PATH)
+    assert aioclient_mock.call_count == 1
+
+    now[0] += 5
+    await client.async_get(API_SCOREBOARD_PATH)
+    assert aioclient_mock.call_count == 2
+    assert client.as_dict()["cache_hits"] == 3
+
+
+async def test_clients_per_league(hass, aioclient_mock):
+    """Test every league gets its own client and endpoint."""
+    mlb = async_get_client(hass)
+    college = async_get_client(hass, "college-baseball")
+
+    assert mlb is async_get_client(hass, "mlb")
+    assert college is not mlb
+    assert college.base_url.endswith("/sports/baseball/college-baseball")
+
+
+async def test_large_documents_parsed_in_executor(hass):
+    """Test documents above the threshold are decoded and parsed in the executor."""
+    client = EspnClient(hass, "baseball", "mlb")
+    body = json.dumps(load_fixture("scoreboard.json")).encode()
+    parse = partial(_find_team_event, team_id="PHI")
+
+    with patch("custom_components.mlb.api.async_fetch_body", return_value=body), patch.object(
+        hass, "async_add_executor_job", wraps=hass.async_add_executor_job
+    ) as mock_executor:
+        with patch("custom_components.mlb.api.EXECUTOR_PARSE_THRESHOLD", len(body)):
+            await client.async_get(API_SCOREBOARD_PATH, parse=parse, executor=True, ttl=0)
+        assert mock_executor.call_count == 0
+
+        with patch("custom_components.mlb.api.EXECUTOR_PARSE_THRESHOLD", 0):
+            game = await client.async_get(API_SCOREBOARD_PATH, parse=parse, executor=True, ttl=0)
+            await client.async_get(API_SCOREBOARD_PATH, parse=parse, executor=False, ttl=0)
+        assert mock_executor.call_count == 2
+
+    assert game["team_abbr"] == "PHI"
+
+
+async def test_scoreboard_unavailable(hass):
+    """Test a failed scoreboard fails the update with a clear message."""
+    with patch("custom_components.mlb.api.async_fetch_body", return_value=None):
+        with pytest.raises(UpdateFailed, match="ESPN scoreboard unavailable"):
+            await async_get_state(hass, CONFIG_DATA, PRIORITY_IDLE, dt_util.utcnow())
+
+
+async def test_shared_request_failures(hass):
+    """Test requests waiting on a failed or cancelled request do not hang."""
+    client = EspnClient(hass, "baseball", "mlb")
+    release = asyncio.Event()
+
+    async def fetch_body(*args):
+        await release.wait()
+        raise aiohttp.ClientError("boom")
+
+    with patch(
+        "custom_components.mlb.api.async_fetch_body", side_effect=fetch_body
+    ) as mock_fetch:
+        owner = asyncio.ensure_future(client.async_get(API_SCOREBOARD_PATH))
+        waiter = asyncio.ensure_future(client.async_get(API_SCOREBOARD_PATH))
+        await asyncio.sleep(0)
+        owner.cancel()
+        with pytest.raises(asyncio.TimeoutError):
+            await waiter
+        assert owner.cancelled()
+
+        owner = asyncio.ensure_future(client.async_get(API_SCOREBOARD_PATH))
+        waiter = asyncio.ensure_future(client.async_get(API_SCOREBOARD_PATH))
+        await asyncio.sleep(0)
+        release.set()
+        for task in (owner, waiter):
+            with pytest.raises(aiohttp.ClientError, match="boom"):
+                await task
+
+    assert mock_fetch.call_count == 2
+    assert client._inflight == {}
+
+
+async def test_fetch_timeout_frees_slot(hass):
+    """Test requests time out while holding a slot, then release it."""
+    session = MagicMock()
+    session.get.return_value.__aenter__.side_effect = asyncio.TimeoutError
+
+    with patch("custom_components.mlb.api.async_get_clientsession", return_value=session):
+        with pytest.raises(asyncio.TimeoutError):
+            await async_fetch_body(hass, "https://example.com")
+
+    assert session.get.call_args.kwargs["timeout"].total == FETCH_TIMEOUT
+    assert async_get_fetch_limit(hass).in_flight == 0
+
+
+async def test_shared_request_takes_best_priority(hass, monkeypatch):
+    """Test a live poll joining a deferred idle request gets it served first."""
+    now = [0.0]
+    budget = RequestBudget(120, 20, clock=lambda: now[0])
+    budget._tokens = 2
+    hass.data[DOMAIN] = {BUDGET: budget}
+    client = EspnClient(hass, "baseball", "mlb")
+    sleep = asyncio.sleep
+
+    async def _sleep(delay, result=None):
+        now[0] += delay
+        return await sleep(0, result)
+
+    monkeypatch.setattr("custom_components.mlb.budget.asyncio.sleep", _sleep)
+    with patch("custom_components.mlb.api.async_get_clientsession", return_value=_session()):
+        idle = asyncio.ensure_future(client.async_get(API_SCOREBOARD_PATH, PRIORITY_IDLE))
+        await sleep(0)
+        assert budget.as_dict()["waiting"]["idle"] == 1
+
+        live = await client.async_get(API_SCOREBOARD_PATH, PRIORITY_LIVE)
+        assert await idle == live == {}
+
+    # An idle request needs 11 tokens, it would have waited 4.5 seconds
+    assert now[0] <= 0.5
+    assert budget.granted[PRIORITY_LIVE] == 1
+    assert budget.granted[PRIORITY_IDLE] == 0
+    assert client.requests == 1
+
+
+async def test_live_fetch_not_blocked_by_idle_fetches(hass):
+    """Test stalled idle requests leave a slot for live scoreboard polls."""
+    release = asyncio.Event()
+    base_url = EspnClient(hass, "baseball", "mlb").base_url
+    session = _session(release, "summary")
+
+    with patch("custom_components.mlb.api.async_get_clientsession", return_value=session):
+        idle = [
+            asyncio.ensure_future(async_fetch_body(hass, f"{base_url}/summary", PRIORITY_IDLE))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        assert async_get_fetch_limit(hass).in_flight == 1
+
+        body = await asyncio.wait_for(
+            async_fetch_body(hass, f"{base_url}/{API_SCOREBOARD_PATH}", PRIORITY_LIVE), 1
+        )
+        assert body == b"{}"
+
+        release.set()
+        assert await asyncio.gather(*idle) == [b"{}", b"{}"]
+    assert async_get_fetch_limit(hass).in_flight == 0
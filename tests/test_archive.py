@@ -0,0 +1,140 @@
+"""Test the game archive."""
+import asyncio
+
+from custom_components.mlb.archive import GameArchive, build_record
+from custom_components.mlb.coordinator import _find_team_event
+from tests.const import load_fixture
+
+GAME = {
+    "event_id": "401472001",
+    "date": "2023-04-01T20:05Z",
+    "team_abbr": "PHI",
+    "opponent_abbr": "TEX",
+    "team_homeaway": "away",
+    "team_score": "7",
+    "opponent_score": "11",
+    "team_record": "0-2",
+    "opponent_record": "2-0",
+    "venue": "Globe Life Field",
+    "team_inning_1": 1,
+    "team_inning_2": 6,
+    "team_inning_3": 0,
+    "opponent_inning_1": 0,
+    "opponent_inning_2": 11,
+    "opponent_inning_3": 0,
+    "team_linescore": [1, 6],
+    "opponent_linescore": [0, 11],
+}
+
+
+async def test_archive_add_and_query(hass, tmp_path):
+    """Test finished games are stored once and can be queried."""
+    archive = GameArchive(hass, str(tmp_path))
+    await archive.async_load()
+
+    record = await archive.async_add(GAME)
+    assert record["team_score"] == 7
+    assert record["team_linescore"] == [1, 6]
+    assert await archive.async_add(GAME) is None
+
+    assert (tmp_path / "2023.jsonl").read_text().count("\n") == 1
+    assert archive.last_games("PHI") == [record]
+    assert archive.head_to_head("PHI", "TEX") == [record]
+    assert archive.head_to_head("PHI", "NYM") == []
+    assert archive.season_record("PHI", 2023) == {"wins": 0, "losses": 1}
+
+
+async def test_archive_reload(hass, tmp_path):
+    """Test the archive is rebuilt from its segment files."""
+    archive = GameArchive(hass, str(tmp_path))
+    await archive.async_load()
+    await archive.async_add(GAME)
+
+    reloaded = GameArchive(hass, str(tmp_path))
+    await reloaded.async_load()
+    assert reloaded.last_games("PHI", 1)[0]["id"] == "401472001"
+    assert await reloaded.async_add(GAME) is None
+
+
+async def test_archive_season_stats(hass, tmp_path):
+    """Test season aggregates are updated once per finished game."""
+    archive = GameArchive(hass, str(tmp_path))
+    await archive.async_load()
+
+    await archive.async_add(GAME)
+    await archive.async_add(
+        {
+            **GAME,
+            "event_id": "401472002",
+            "date": "2023-04-02T20:05Z",
+            "team_homeaway": "home",
+            "team_score": "5",
+            "opponent_score": "2",
+        }
+    )
+    await archive.async_add(
+        {
+            **GAME,
+            "event_id": "401472003",
+            "date": "2023-04-03T20:05Z",
+            "team_homeaway": "home",
+            "team_score": "3",
+            "opponent_score": "1",
+        }
+    )
+
+    stats = archive.season_stats("PHI")
+    assert stats["record"] == "2-1"
+    assert stats["streak"] == "W2"
+    assert stats["last_10"] == "2-1"
+    assert stats["run_differential"] == 1
+    assert stats["home_record"] == "2-0"
+    assert stats["away_record"] == "0-1"
+    assert archive.season_stats("PHI", 2022)["record"] == "0-0"
+
+
+async def test_archive_leagues(hass, tmp_path):
+    """Test teams with the same abbreviation in two leagues are kept apart."""
+    archive = GameArchive(hass, str(tmp_path))
+    await archive.async_load()
+
+    mlb = await archive.async_add(GAME)
+    college = await archive.async_add(GAME, "college-baseball")
+    assert mlb["league"] == "mlb"
+    assert college["league"] == "college-baseball"
+
+    assert archive.last_games("PHI") == [mlb]
+    assert archive.last_games("PHI", league="college-baseball") == [college]
+    assert archive.season_stats("PHI", 2023, "college-baseball")["record"] == "0-1"
+    assert archive.season_stats("PHI", league="softball")["record"] == "0-0"
+
+
+async def test_archive_records_without_league(hass, tmp_path):
+    """Test records archived before leagues were stored load as MLB games."""
+    (tmp_path / "2023.jsonl").write_text(
+        '{"id":"401472001","date":"2023-04-01T20:05Z","season":2023,"team":"PHI",'
+        '"opponent":"TEX","homeaway":"away","team_score":7,"opponent_score":11}\n'
+    )
+    archive = GameArchive(hass, str(tmp_path))
+    await archive.async_load()
+
+    assert archive.last_games("PHI")[0]["league"] == "mlb"
+    assert await archive.async_add(GAME) is None
+
+
+def test_record_linescore():
+    """Test records only hold the innings actually played."""
+    record = build_record(_find_team_event(load_fixture("scoreboard.json"), "PHI"))
+    assert record["team_linescore"] == [1, 0, 2, 0, 0]
+    assert record["opponent_linescore"] == [0, 1, 0, 1]
+
+
+async def test_archive_concurrent_adds(hass, tmp_path):
+    """Test overlapping refreshes archive a finished game once."""
+    archive = GameArchive(hass, str(tmp_path))
+    await archive.async_load()
+
+    records = await asyncio.gather(archive.async_add(GAME), archive.async_add(GAME))
+    assert sum(record is not None for record in records) == 1
+    assert (tmp_path / "2023.jsonl").read_text().count("\n") == 1
+    assert len(archive.last_games("PHI")) == 1
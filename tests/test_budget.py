@@ -0,0 +1,38 @@
+"""Test the request budget."""
+from custom_components.mlb.budget import RequestBudget
+from custom_components.mlb.const import PRIORITY_IDLE, PRIORITY_LIVE, PRIORITY_PRE
+
+
+async def test_budget_prioritizes_live_polls():
+    """Test live polls may drain the bucket while idle polls are deferred."""
+    now = [0.0]
+    budget = RequestBudget(60, 4, clock=lambda: now[0])
+
+    for _ in range(2):
+        await budget.async_acquire(PRIORITY_IDLE)
+    for _ in range(2):
+        await budget.async_acquire(PRIORITY_LIVE)
+
+    assert budget.granted[PRIORITY_IDLE] == 2
+    assert budget.granted[PRIORITY_LIVE] == 2
+    assert budget.deferred[PRIORITY_IDLE] == 0
+    assert budget.as_dict()["tokens_available"] == 0
+
+
+async def test_budget_defers_low_priority(monkeypatch):
+    """Test a deferred poll is served once the bucket has refilled."""
+    now = [0.0]
+    budget = RequestBudget(60, 4, clock=lambda: now[0])
+
+    async def _sleep(delay):
+        now[0] += delay
+
+    monkeypatch.setattr("custom_components.mlb.budget.asyncio.sleep", _sleep)
+
+    for _ in range(3):
+        await budget.async_acquire(PRIORITY_PRE)
+    await budget.async_acquire(PRIORITY_IDLE)
+
+    assert budget.deferred[PRIORITY_IDLE] == 1
+    assert budget.granted[PRIORITY_IDLE] == 1
+    assert now[0] >= 2
@@ -86,3 +86,42 @@ async def test_form(
 #         await hass.async_block_till_done()
 
 #     assert result["type"] == "create_entry"
+
+
+async def test_options_flow(hass):
+    """Test the options form defaults to the entry and saves every option."""
+    entry = MockConfigEntry(domain=DOMAIN, title="MLB", data={**CONFIG_DATA, "timeout": 120})
+    entry.add_to_hass(hass)
+
+    with patch("custom_components.mlb.async_setup_entry", return_value=True):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+        result = await hass.config_entries.options.async_init(entry.entry_id)
+        assert result["type"] == "form"
+        assert result["step_id"] == "init"
+        defaults = {str(key): key.default() for key in result["data_schema"].schema}
+        assert defaults == {
+            "team_id": "PHI",
+            "name": "MLB",
+            "timeout": 120,
+            "profile": "standard",
+            "parse_in_executor": True,
+            "enrichment": False,
+            "league": "mlb",
+            "alerts": [],
+        }
+
+        options = {
+            **defaults,
+            "profile": "eco",
+            "parse_in_executor": False,
+            "enrichment": True,
+            "league": "college-baseball",
+            "alerts": ["final", "lead_change"],
+        }
+        result = await hass.config_entries.options.async_configure(result["flow_id"], options)
+        await hass.async_block_till_done()
+
+    assert result["type"] == "create_entry"
+    assert entry.options == options
@@ -0,0 +1,51 @@
+"""Test the game summary enrichment."""
+from unittest.mock import patch
+
+from custom_components.mlb.api import async_get_client
+
+from custom_components.mlb.enrichment import SummaryCache, parse_summary
+from tests.const import load_fixture
+
+
+def test_parse_summary():
+    """Test probables, pitchers of record and box score totals are extracted."""
+    enrichment = parse_summary(load_fixture("summary.json"))
+
+    assert enrichment["probable_pitchers"] == {"ATL": "Max Fried", "PHI": "Zack Wheeler"}
+    assert enrichment["pitchers_of_record"] == {
+        "winning_pitcher": "Zack Wheeler",
+        "losing_pitcher": "Max Fried",
+        "save_pitcher": "Jose Alvarado",
+    }
+    assert enrichment["boxscore"]["PHI"]["batting"]["homeRuns"] == "2"
+    assert "avg" not in enrichment["boxscore"]["ATL"]["batting"]
+    assert "ERA" not in enrichment["boxscore"]["ATL"]["pitching"]
+
+
+async def test_summary_cache_ttl(hass):
+    """Test summaries are fetched once per phase and throttled while live."""
+    now = [0.0]
+    cache = SummaryCache(async_get_client(hass), clock=lambda: now[0])
+    summary = parse_summary(load_fixture("summary.json"))
+
+    with patch(
+        "custom_components.mlb.api.EspnClient.async_get", return_value=summary
+    ) as mock_fetch:
+        assert cache.is_stale("401569001", "PRE")
+        await cache.async_update("401569001", "PRE")
+        now[0] += 3600
+        assert not cache.is_stale("401569001", "PRE")
+
+        assert cache.is_stale("401569001", "IN")
+        await cache.async_update("401569001", "IN")
+        now[0] += 60
+        assert not cache.is_stale("401569001", "IN")
+        now[0] += 60
+        assert cache.is_stale("401569001", "IN")
+
+        await cache.async_update("401569001", "POST")
+        now[0] += 3600
+        assert not cache.is_stale("401569001", "POST")
+
+    assert mock_fetch.call_count == 3
+    assert cache.get("401569001") == summary
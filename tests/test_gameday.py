@@ -0,0 +1,187 @@
+"""Drive a coordinator through a simulated game day on a fake clock."""
+import copy
+from datetime import datetime, timedelta, timezone
+import json
+from unittest.mock import patch
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.mlb.api import EspnClient
+from custom_components.mlb.archive import GameArchive
+from custom_components.mlb.budget import RequestBudget
+from custom_components.mlb.const import (
+    ARCHIVE,
+    BUDGET,
+    CLIENTS,
+    DEFAULT_LEAGUE,
+    DEFAULT_SPORT,
+    DOMAIN,
+    REQUEST_BUDGET_BURST,
+    REQUEST_BUDGET_PER_MINUTE,
+)
+from custom_components.mlb.coordinator import (
+    AlertsDataUpdateCoordinator,
+    _find_team_event,
+    coordinator_phase,
+    humanize,
+)
+from tests.const import CONFIG_DATA, load_fixture
+
+START = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+FIRST_PITCH = datetime(2024, 5, 1, 23, 20, tzinfo=timezone.utc)
+FINAL = FIRST_PITCH + timedelta(hours=3)
+END = datetime(2024, 5, 2, 4, 0, tzinfo=timezone.utc)
+
+SLOW = timedelta(minutes=10)
+FAST = timedelta(seconds=5)
+
+
+class GameDay:
+    """Fake clock and ESPN scoreboard for the PHI @ ATL fixture game."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.now = START
+        self.requests = 0
+        self._fixture = load_fixture("scoreboard.json")
+
+    def clock(self) -> datetime:
+        """Return the simulated UTC time."""
+        return self.now
+
+    def monotonic(self) -> float:
+        """Return the simulated seconds elapsed."""
+        return (self.now - START).total_seconds()
+
+    def scoreboard(self) -> dict:
+        """Return the scoreboard as ESPN would serve it at the simulated time."""
+        scoreboard = copy.deepcopy(self._fixture)
+        event = scoreboard["events"][0]
+        competition = event["competitions"][0]
+        if self.now < FIRST_PITCH:
+            status = {"period": 0, "type": {"state": "pre", "description": "Scheduled"}}
+            del competition["situation"]
+        elif self.now < FINAL:
+            status = event["status"]
+        else:
+            status = {"period": 9, "type": {"state": "post", "description": "Final"}}
+            del competition["situation"]
+        event["status"] = competition["status"] = status
+        return scoreboard
+
+    async def fetch_body(self, hass, url, priority, params=None) -> bytes:
+        """Serve a scoreboard request."""
+        self.requests += 1
+        return json.dumps(self.scoreboard()).encode()
+
+
+async def _simulate(hass, config: dict, archive_path) -> tuple:
+    """Poll a full game day, returns the interval transitions and the day."""
+    day = GameDay()
+    hass.data[DOMAIN] = {
+        # The game goes final, keep its archive out of the config directory
+        ARCHIVE: GameArchive(hass, str(archive_path)),
+        BUDGET: RequestBudget(
+            REQUEST_BUDGET_PER_MINUTE, REQUEST_BUDGET_BURST, clock=day.monotonic
+        ),
+        CLIENTS: {
+            (DEFAULT_SPORT, DEFAULT_LEAGUE): EspnClient(
+                hass, DEFAULT_SPORT, DEFAULT_LEAGUE, clock=day.monotonic
+            )
+        },
+    }
+    coordinator = AlertsDataUpdateCoordinator(hass, config, 120, clock=day.clock, phase=0.0)
+
+    transitions = []
+    with patch("custom_components.mlb.api.async_fetch_body", side_effect=day.fetch_body):
+        while day.now < END:
+            await coordinator.async_refresh()
+            assert coordinator.last_update_success
+            phase = (coordinator.data["state"], coordinator.interval)
+            if not transitions or transitions[-1][1:] != phase:
+                transitions.append((day.now, *phase))
+            day.now += coordinator.update_interval
+
+    # The final score was the last change
+    assert dt_util.parse_datetime(coordinator.data["last_update"]) == FINAL
+    assert (archive_path / "2024.jsonl").read_text().count("\n") == 1
+    return transitions, day
+
+
+async def test_game_day(hass, tmp_path):
+    """Test polling intervals and request counts over a full game day."""
+    transitions, day = await _simulate(hass, CONFIG_DATA, tmp_path)
+    assert transitions == [
+        (START, "PRE", SLOW),
+        (FIRST_PITCH - timedelta(minutes=10), "PRE", FAST),
+        (FIRST_PITCH, "IN", FAST),
+        (FINAL, "POST", SLOW),
+    ]
+    # 12:00 to 23:00 every 10 minutes, 23:10 to 02:20 every 5 seconds,
+    # then 02:20 to 03:50 every 10 minutes
+    assert day.requests == 67 + 2280 + 10
+
+
+async def test_game_day_eco(hass, tmp_path):
+    """Test the eco profile caps live polling."""
+    transitions, day = await _simulate(hass, {**CONFIG_DATA, "profile": "eco"}, tmp_path)
+    eco = timedelta(seconds=30)
+    assert transitions == [
+        (START, "PRE", SLOW),
+        (FIRST_PITCH - timedelta(minutes=10), "PRE", eco),
+        (FIRST_PITCH, "IN", eco),
+        (FINAL, "POST", SLOW),
+    ]
+    # Same as above, with 23:10 to 02:20 every 30 seconds
+    assert day.requests == 67 + 380 + 10
+
+
+def test_eco_parse():
+    """Test the eco profile skips line scores, logos and colours."""
+    scoreboard = load_fixture("scoreboard.json")
+    standard = _find_team_event(scoreboard, "PHI")
+    eco = _find_team_event(scoreboard, "PHI", eco=True)
+
+    assert standard["team_inning_3"] == 2
+    assert standard["team_inning_9"] == 0
+    assert standard["team_colors"][0].startswith("#")
+    for key in ("team_inning_3", "opponent_inning_9", "team_logo", "opponent_colors"):
+        assert eco[key] is None
+    assert eco["team_linescore"] == eco["opponent_linescore"] == []
+
+    skipped = {key for key in standard if "inning_" in key or key.endswith(("_logo", "_colors"))}
+    skipped |= {"team_linescore", "opponent_linescore"}
+    assert {key: value for key, value in eco.items() if key not in skipped} == {
+        key: value for key, value in standard.items() if key not in skipped
+    }
+
+
+async def test_phase_offsets(hass):
+    """Test polls land on the league's slot whenever the previous poll ran."""
+    day = GameDay()
+    mlb, college = (
+        AlertsDataUpdateCoordinator(
+            hass, {**CONFIG_DATA, "league": league}, 120, clock=day.clock
+        )
+        for league in ("mlb", "college-baseball")
+    )
+    assert mlb.phase == coordinator_phase("mlb")
+    assert mlb.phase != college.phase
+
+    for interval in (FAST, SLOW):
+        seconds = interval.total_seconds()
+        for late in (0.0, 1.3, 2.7, 4.9):
+            day.now = START + timedelta(seconds=late)
+            for coordinator in (mlb, college):
+                delay = coordinator._next_poll(interval)
+                assert seconds / 2 <= delay.total_seconds() < seconds * 1.5
+                slot = (day.now + delay).timestamp() / seconds - coordinator.phase
+                assert abs(slot - round(slot)) < 1e-6
+
+
+def test_humanize():
+    """Test relative first pitch times."""
+    assert humanize(FIRST_PITCH, FIRST_PITCH - timedelta(seconds=30)) == "just now"
+    assert humanize(FIRST_PITCH, FIRST_PITCH - timedelta(minutes=30)) == "in 30 minutes"
+    assert humanize(FIRST_PITCH, FIRST_PITCH + timedelta(hours=2)) == "2 hours ago"
+    assert humanize(FIRST_PITCH, FIRST_PITCH - timedelta(days=3)) == "in 3 days"
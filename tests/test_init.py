@@ -8,7 +8,13 @@ from homeassistant.helpers.entity_registry import async_get
 from homeassistant.setup import async_setup_component
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.mlb.const import CONF_TEAM_ID, DOMAIN
+from custom_components.mlb.const import (
+    CONF_TEAM_ID,
+    COORDINATOR,
+    COORDINATORS,
+    DEFAULT_TIMEOUT,
+    DOMAIN,
+)
 from tests.const import CONFIG_DATA
 
 
@@ -26,7 +32,7 @@ async def test_setup_entry(
     assert await hass.config_entries.async_setup(entry.entry_id)
     await hass.async_block_till_done()
 
-    assert len(hass.states.async_entity_ids(SENSOR_DOMAIN)) == 1
+    assert len(hass.states.async_entity_ids(SENSOR_DOMAIN)) == 2
     entries = hass.config_entries.async_entries(DOMAIN)
     assert len(entries) == 1
 
@@ -43,13 +49,13 @@ async def test_unload_entry(hass):
     assert await hass.config_entries.async_setup(entry.entry_id)
     await hass.async_block_till_done()
 
-    assert len(hass.states.async_entity_ids(SENSOR_DOMAIN)) == 1
+    assert len(hass.states.async_entity_ids(SENSOR_DOMAIN)) == 2
     entries = hass.config_entries.async_entries(DOMAIN)
     assert len(entries) == 1
 
     assert await hass.config_entries.async_unload(entries[0].entry_id)
     await hass.async_block_till_done()
-    assert len(hass.states.async_entity_ids(SENSOR_DOMAIN)) == 1
+    assert len(hass.states.async_entity_ids(SENSOR_DOMAIN)) == 2
     assert len(hass.states.async_entity_ids(DOMAIN)) == 0
 
     assert await hass.config_entries.async_remove(entries[0].entry_id)
@@ -57,6 +63,102 @@ async def test_unload_entry(hass):
     assert len(hass.states.async_entity_ids(SENSOR_DOMAIN)) == 0
 
 
+async def test_services_without_entries(hass, hass_ws_client):
+    """Test YAML only setups get the services and websocket commands."""
+    with patch("custom_components.mlb.coordinator.update_game", return_value={}):
+        assert await async_setup_component(
+            hass, SENSOR_DOMAIN, {SENSOR_DOMAIN: [{"platform": DOMAIN, CONF_TEAM_ID: "PHI"}]}
+        )
+        await hass.async_block_till_done()
+
+    assert hass.config_entries.async_entries(DOMAIN) == []
+    for service in ("get_games", "get_season_stats", "get_plays"):
+        assert hass.services.has_service(DOMAIN, service)
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 1, "type": "mlb/get_plays", "team_id": "PHI"})
+    assert (await client.receive_json())["success"]
+
+
+async def test_entries_share_coordinator(hass):
+    """Test entries for the same team share one reference counted coordinator."""
+    entries = [
+        MockConfigEntry(domain=DOMAIN, title=title, data={**CONFIG_DATA, CONF_NAME: title})
+        for title in ("MLB", "Phillies")
+    ]
+    for entry in entries:
+        entry.add_to_hass(hass)
+
+    with patch("custom_components.mlb.coordinator.update_game", return_value={}):
+        assert await async_setup_component(hass, DOMAIN, {})
+        await hass.async_block_till_done()
+
+    first, second = (hass.data[DOMAIN][entry.entry_id][COORDINATOR] for entry in entries)
+    assert first is second
+    assert first.consumers == 2
+    assert list(hass.data[DOMAIN][COORDINATORS]) == [("mlb", "PHI")]
+
+    assert await hass.config_entries.async_unload(entries[0].entry_id)
+    assert first.consumers == 1
+    assert ("mlb", "PHI") in hass.data[DOMAIN][COORDINATORS]
+
+    assert await hass.config_entries.async_unload(entries[1].entry_id)
+    assert hass.data[DOMAIN][COORDINATORS] == {}
+
+
+async def test_shared_coordinator_merges_options(hass):
+    """Test a shared coordinator polls with the options of every entry."""
+    entries = [
+        MockConfigEntry(domain=DOMAIN, title=title, data={**CONFIG_DATA, **options})
+        for title, options in (
+            ("MLB", {"alerts": ["final"], "profile": "eco"}),
+            ("Phillies", {"alerts": ["lead_change"], "enrichment": True, "timeout": 300}),
+        )
+    ]
+    for entry in entries:
+        entry.add_to_hass(hass)
+
+    with patch("custom_components.mlb.coordinator.update_game", return_value={}):
+        assert await async_setup_component(hass, DOMAIN, {})
+        await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN][entries[0].entry_id][COORDINATOR]
+    assert coordinator.config["alerts"] == ["final", "lead_change"]
+    assert not coordinator.eco
+    assert coordinator.enrichment_enabled
+    assert coordinator.timeout == 300
+
+    assert await hass.config_entries.async_unload(entries[1].entry_id)
+    assert coordinator.config["alerts"] == ["final"]
+    assert coordinator.eco
+    assert not coordinator.enrichment_enabled
+    assert coordinator.timeout == DEFAULT_TIMEOUT
+
+
+async def test_yaml_shares_coordinator(hass):
+    """Test a YAML sensor and a config entry for a team share one coordinator."""
+    entry = MockConfigEntry(domain=DOMAIN, title="MLB", data=CONFIG_DATA)
+    entry.add_to_hass(hass)
+
+    with patch("custom_components.mlb.coordinator.update_game", return_value={}):
+        assert await async_setup_component(
+            hass,
+            SENSOR_DOMAIN,
+            {SENSOR_DOMAIN: [{"platform": DOMAIN, CONF_TEAM_ID: "PHI", CONF_NAME: "Phillies"}]},
+        )
+        await hass.async_block_till_done()
+
+    coordinators = hass.data[DOMAIN][COORDINATORS]
+    assert list(coordinators) == [("mlb", "PHI")]
+    coordinator = coordinators[("mlb", "PHI")]
+    assert coordinator.consumers == 2
+    assert len(hass.states.async_entity_ids(SENSOR_DOMAIN)) == 4
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    assert coordinators == {("mlb", "PHI"): coordinator}
+    assert coordinator.consumers == 1
+
+
 # async def test_import(hass):
 #     """Test importing a config."""
 #     entry = MockConfigEntry(
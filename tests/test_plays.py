@@ -0,0 +1,43 @@
+"""Test the recent play history."""
+from custom_components.mlb.plays import PlayHistory, play_key
+
+GAME = {"event_id": "401569001", "inning": 5, "team_score": "3", "opponent_score": "2"}
+
+
+def _play(text, play_id=None, event_id="401569001"):
+    """Return a coordinator update with a last play."""
+    return {**GAME, "event_id": event_id, "last_play": text, "last_play_id": play_id}
+
+
+def test_plays_deduplicated():
+    """Test a play seen on several polls is recorded once."""
+    history = PlayHistory()
+    assert history.add(_play("Riley singled.", "1"))
+    assert not history.add(_play("Riley singled.", "1"))
+    assert history.add(_play("Olson walked."))
+    assert not history.add(_play("Olson walked."))
+    assert not history.add({**GAME, "last_play": None})
+
+    assert [play["text"] for play in history.recent("401569001")] == [
+        "Olson walked.",
+        "Riley singled.",
+    ]
+    assert history.recent("401569001")[1]["id"] == "1"
+    assert play_key(_play("Olson walked.")) == play_key(_play("Olson walked."))
+
+
+def test_plays_bounded():
+    """Test the history keeps the newest plays of the newest games."""
+    history = PlayHistory(size=3, games=2)
+    for number in range(5):
+        history.add(_play(f"Play {number}", str(number)))
+    assert [play["id"] for play in history.recent("401569001")] == ["4", "3", "2"]
+    assert history.recent("401569001", 1)[0]["id"] == "4"
+
+    # An evicted play is no longer remembered as seen
+    assert history.add(_play("Play 0", "0"))
+
+    history.add(_play("Play", "1", event_id="401569002"))
+    history.add(_play("Play", "1", event_id="401569003"))
+    assert history.recent("401569001") == []
+    assert len(history.recent("401569003")) == 1
@@ -0,0 +1,77 @@
+"""Test the recorder footprint of the sensor."""
+import json
+from unittest.mock import patch
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import callback
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.mlb.const import COORDINATOR, DOMAIN
+from custom_components.mlb.coordinator import _find_team_event
+from custom_components.mlb.sensor import MLBScoresSensor
+from tests.const import CONFIG_DATA, load_fixture
+
+# A three hour game polled every 5 seconds
+POLLS = 3 * 60 * 12
+
+
+def _row_bytes(states, unrecorded):
+    """Return the bytes of the attribute rows the recorder would store.
+
+    The recorder keeps one row per distinct set of recorded attributes.
+    """
+    rows = {
+        json.dumps(
+            {key: value for key, value in attributes.items() if key not in unrecorded},
+            sort_keys=True,
+            default=str,
+        )
+        for attributes in states
+    }
+    return sum(len(row) for row in rows)
+
+
+def _poll(game: dict, poll: int) -> dict:
+    """Return the game as async_get_state returns it on a poll."""
+    return {
+        **game,
+        "inning": 1 + poll * 9 // POLLS,
+        "team_score": str(poll // 400),
+        "last_play": f"Play {poll // 6}",
+        "last_update": f"2024-05-01T19:{poll // 12 % 60:02d}:{poll % 12 * 5:02d}-04:00",
+    }
+
+
+async def test_recorder_rows_per_game(hass):
+    """Test polls that do not change the game write no state or attribute rows."""
+    game = _find_team_event(load_fixture("scoreboard.json"), "PHI")
+    entry = MockConfigEntry(domain=DOMAIN, title="MLB", data=CONFIG_DATA)
+    entry.add_to_hass(hass)
+    with patch("custom_components.mlb.coordinator.update_game", return_value=_poll(game, 0)):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done(wait_background_tasks=True)
+    coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+
+    # The recorder writes a states row for every state_changed event
+    states = []
+
+    @callback
+    def _state_changed(event):
+        if event.data["entity_id"] == "sensor.mlb":
+            states.append(dict(event.data["new_state"].attributes))
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _state_changed)
+    polls = [_poll(game, poll) for poll in range(POLLS)]
+    for data in polls:
+        with patch("custom_components.mlb.coordinator.update_game", return_value=dict(data)):
+            await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    # One states row per change of the game after the first poll, not per poll
+    changes = {(data["inning"], data["team_score"], data["last_play"]) for data in polls}
+    assert len(states) == len(changes) - 1
+    assert len(states) * 5 < POLLS
+
+    before = _row_bytes(states, frozenset())
+    after = _row_bytes(states, MLBScoresSensor._unrecorded_attributes)
+    assert after * 10 < before
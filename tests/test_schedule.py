@@ -0,0 +1,110 @@
+"""Test the batched schedule loader."""
+import copy
+from datetime import datetime, timedelta, timezone
+import json
+from unittest.mock import patch
+
+from custom_components.mlb.schedule import async_get_schedule
+from tests.const import load_fixture
+
+NOW = datetime(2024, 5, 1, 18, 0, tzinfo=timezone.utc)
+
+
+def _event(event_id, date, away, home, state="pre"):
+    """Return a scoreboard event between two teams."""
+    event = copy.deepcopy(load_fixture("scoreboard.json")["events"][1])
+    event["id"] = event_id
+    event["date"] = date
+    event["shortName"] = f"{away} @ {home}"
+    competitors = event["competitions"][0]["competitors"]
+    competitors[0]["team"]["abbreviation"] = home
+    competitors[1]["team"]["abbreviation"] = away
+    event["status"]["type"]["state"] = state
+    event["competitions"][0]["status"]["type"]["state"] = state
+    return event
+
+
+WEEKS = {
+    "20240501-20240507": [
+        _event("1", "2024-04-30T23:05Z", "SEA", "TEX", state="post"),
+        _event("2", "2024-05-02T23:05Z", "NYM", "WSH"),
+        _event("4", "2024-05-01T20:05Z", "MIA", "CHC"),
+    ],
+    "20240508-20240514": [
+        _event("3", "2024-05-09T23:05Z", "NYM", "SEA"),
+        _event("5", "2024-05-10T23:05Z", "MIA", "SD"),
+    ],
+}
+
+
+class FakeEspn:
+    """Serve date range scoreboards, optionally failing some of them."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.requests = []
+        self.failing = set()
+
+    async def fetch_body(self, hass, url, priority, params=None):
+        """Serve a schedule request."""
+        self.requests.append(params["dates"])
+        if params["dates"] in self.failing:
+            return None
+        return json.dumps({"events": WEEKS.get(params["dates"], [])}).encode()
+
+
+async def test_schedule_batches_and_next_games(hass):
+    """Test two range requests cover 14 days and yield each team's next game."""
+    espn = FakeEspn()
+    schedule = async_get_schedule(hass)
+    with patch("custom_components.mlb.api.async_fetch_body", side_effect=espn.fetch_body):
+        assert (await schedule.async_next_game("NYM", NOW))["id"] == "2"
+        assert (await schedule.async_next_game("SEA", NOW))["id"] == "3"
+        assert await schedule.async_next_game("TEX", NOW) is None
+
+    assert espn.requests == ["20240501-20240507", "20240508-20240514"]
+
+
+async def test_schedule_daily_cadence(hass):
+    """Test the schedule is loaded once a day."""
+    espn = FakeEspn()
+    schedule = async_get_schedule(hass)
+    with patch("custom_components.mlb.api.async_fetch_body", side_effect=espn.fetch_body):
+        await schedule.async_next_game("NYM", NOW)
+        await schedule.async_next_game("NYM", NOW + timedelta(hours=2))
+        assert len(espn.requests) == 2
+
+        await schedule.async_next_game("NYM", NOW + timedelta(days=1))
+        assert len(espn.requests) == 4
+
+
+async def test_schedule_retries_failed_chunk(hass):
+    """Test a failed chunk is retried instead of disabling the schedule for the day."""
+    espn = FakeEspn()
+    espn.failing.add("20240508-20240514")
+    schedule = async_get_schedule(hass)
+    with patch("custom_components.mlb.api.async_fetch_body", side_effect=espn.fetch_body):
+        assert (await schedule.async_next_game("NYM", NOW))["id"] == "2"
+        assert await schedule.async_next_game("SEA", NOW) is None
+        assert len(espn.requests) == 4
+
+        espn.failing.clear()
+        assert (await schedule.async_next_game("SEA", NOW))["id"] == "3"
+        assert len(espn.requests) == 6
+
+        await schedule.async_next_game("SEA", NOW)
+        assert len(espn.requests) == 6
+
+
+async def test_schedule_skips_started_games(hass):
+    """Test games whose first pitch passed since the daily load are skipped."""
+    espn = FakeEspn()
+    schedule = async_get_schedule(hass)
+    with patch("custom_components.mlb.api.async_fetch_body", side_effect=espn.fetch_body):
+        assert (await schedule.async_next_game("MIA", NOW))["id"] == "4"
+        assert (await schedule.async_next_game("CHC", NOW))["id"] == "4"
+
+        later = NOW + timedelta(hours=3)
+        assert (await schedule.async_next_game("MIA", later))["id"] == "5"
+        assert await schedule.async_next_game("CHC", later) is None
+        assert len(espn.requests) == 2
@@ -0,0 +1,71 @@
+"""Test integration import and setup time."""
+import subprocess
+import sys
+import time
+
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.mlb.const import (
+    API_BASE_URL,
+    API_SCOREBOARD_PATH,
+    DEFAULT_LEAGUE,
+    DEFAULT_SPORT,
+    DOMAIN,
+)
+from tests.const import load_fixture
+
+# Seconds, generous enough for slow CI runners
+IMPORT_TIME_BUDGET = 0.3
+SETUP_TIME_BUDGET = 1.0
+
+# Home Assistant modules the integration builds on, imported before timing
+HA_IMPORTS = (
+    "homeassistant.components.sensor",
+    "homeassistant.components.websocket_api",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.aiohttp_client",
+    "homeassistant.helpers.config_validation",
+    "homeassistant.helpers.entity_registry",
+    "homeassistant.helpers.update_coordinator",
+)
+
+
+def test_import_time():
+    """Test importing the integration on top of Home Assistant is cheap."""
+    code = (
+        "import time\n"
+        + "".join(f"import {module}\n" for module in HA_IMPORTS)
+        + "start = time.perf_counter()\n"
+        "import custom_components.mlb\n"
+        "print(time.perf_counter() - start)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    )
+    assert float(result.stdout) < IMPORT_TIME_BUDGET
+
+
+async def test_setup_entry_time(hass, aioclient_mock):
+    """Test several entries are set up in parallel without waiting on ESPN."""
+    base_url = API_BASE_URL.format(sport=DEFAULT_SPORT, league=DEFAULT_LEAGUE)
+    aioclient_mock.get(f"{base_url}/{API_SCOREBOARD_PATH}", json=load_fixture("scoreboard.json"))
+
+    entries = []
+    for team_id in ("PHI", "ATL", "NYM", "WSH"):
+        entry = MockConfigEntry(
+            domain=DOMAIN, title=team_id, data={"name": team_id, "team_id": team_id}
+        )
+        entry.add_to_hass(hass)
+        entries.append(entry)
+
+    start = time.perf_counter()
+    assert await async_setup_component(hass, DOMAIN, {})
+    elapsed = time.perf_counter() - start
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert elapsed < SETUP_TIME_BUDGET
+    assert len(hass.states.async_entity_ids("sensor")) == 2 * len(entries)
+    assert all(entry.state.value == "loaded" for entry in entries)
+    # The first refresh of every team is answered by one scoreboard request
+    assert aioclient_mock.call_count == 1
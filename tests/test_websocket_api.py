@@ -0,0 +1,121 @@
+"""Test the MLB websocket API."""
+from unittest.mock import patch
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.mlb.coordinator import _find_team_event
+from custom_components.mlb.const import COORDINATOR, DOMAIN
+from tests.const import CONFIG_DATA, load_fixture
+
+# update_game is patched out, so add the poll time async_get_state would set
+GAME = {
+    **_find_team_event(load_fixture("scoreboard.json"), "PHI"),
+    "last_update": "2024-05-01T19:45:00-04:00",
+}
+
+
+async def _setup_entry(hass):
+    """Set up an entry polling the fixture game."""
+    entry = MockConfigEntry(domain=DOMAIN, title="MLB", data=CONFIG_DATA)
+    entry.add_to_hass(hass)
+    with patch("custom_components.mlb.coordinator.update_game", return_value=dict(GAME)):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        await hass.data[DOMAIN][entry.entry_id][COORDINATOR].async_refresh()
+    return entry
+
+
+async def test_subscribe_game(hass, hass_ws_client):
+    """Test subscribers get a snapshot and then changed fields only."""
+    entry = await _setup_entry(hass)
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 1, "type": "mlb/subscribe_game", "team_id": "PHI"})
+    assert (await client.receive_json())["success"]
+    snapshot = (await client.receive_json())["event"]["snapshot"]
+    assert snapshot["state"] == "IN"
+    assert snapshot["team_score"] == "3"
+    assert snapshot["inning"] == 5
+    assert snapshot["situation"] == {
+        "balls": 2,
+        "strikes": 1,
+        "outs": 1,
+        "bases": 5,
+        "batter": "M. Olson",
+        "pitcher": "Z. Wheeler",
+    }
+
+    coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+    coordinator.async_set_updated_data(
+        {**GAME, "team_score": "4", "last_play": "Harper homered."}
+    )
+    delta = (await client.receive_json())["event"]["delta"]
+    assert delta == {"team_score": "4", "last_play": "Harper homered."}
+
+    situation = {**GAME["situation"], "strikes": 2}
+    coordinator.async_set_updated_data(
+        {**GAME, "team_score": "4", "last_play": "Harper homered.", "situation": situation}
+    )
+    delta = (await client.receive_json())["event"]["delta"]
+    assert delta == {"situation": situation}
+
+
+async def test_subscribe_survives_reload(hass, hass_ws_client):
+    """Test subscribers keep getting updates after the entry is reloaded."""
+    entry = await _setup_entry(hass)
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 1, "type": "mlb/subscribe_game", "team_id": "PHI"})
+    assert (await client.receive_json())["success"]
+    await client.receive_json()
+
+    with patch("custom_components.mlb.coordinator.update_game", return_value=dict(GAME)):
+        assert await hass.config_entries.async_reload(entry.entry_id)
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+    coordinator.async_set_updated_data({**GAME, "team_score": "4"})
+    delta = (await client.receive_json())["event"]["delta"]
+    assert delta == {"team_score": "4"}
+
+
+async def test_subscribe_unknown_team(hass, hass_ws_client):
+    """Test subscribing to a team that is not configured."""
+    await _setup_entry(hass)
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 1, "type": "mlb/subscribe_game", "team_id": "SEA"})
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "not_found"
+
+
+async def test_get_plays(hass, hass_ws_client):
+    """Test recent plays are returned newest first, without repeats."""
+    entry = await _setup_entry(hass)
+    coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+    homer = {
+        **GAME,
+        "last_play": "Harper homered.",
+        "last_play_id": "4015690010502",
+        "last_update": "2024-05-01T19:46:00-04:00",
+    }
+    for data in (GAME, homer, homer):
+        with patch("custom_components.mlb.coordinator.update_game", return_value=dict(data)):
+            await coordinator.async_refresh()
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 1, "type": "mlb/get_plays", "team_id": "PHI"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["event_id"] == GAME["event_id"]
+    assert [play["text"] for play in response["result"]["plays"]] == [
+        "Harper homered.",
+        "Riley singled to left, Acuna Jr. to third.",
+    ]
+    assert [play["time"] for play in response["result"]["plays"]] == [
+        homer["last_update"],
+        GAME["last_update"],
+    ]
+
+    await client.send_json({"id": 2, "type": "mlb/get_plays", "team_id": "PHI", "limit": 1})
+    response = await client.receive_json()
+    assert [play["id"] for play in response["result"]["plays"]] == ["4015690010502"]